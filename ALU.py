@@ -0,0 +1,169 @@
+# Integer only 6502 arithmetic
+# https://www.nesdev.org/wiki/Instruction_reference
+# http://www.righto.com/2012/12/the-6502-overflow-flag-explained.html
+
+# Every primitive takes and returns plain ints (0-255). Carry in/out can be a bool or 0/1.
+# N and Z aren't returned, the CPU gets both of them from the 8 bit result.
+
+def adc(a: int, m: int, carry: int = 0):
+    total = a + m + carry
+    result = total & 0xFF
+    # overflow when both inputs have the same sign and the result has the other one
+    overflow = ((a ^ result) & (m ^ result) & 0x80) != 0
+    return result, total > 0xFF, overflow
+
+def sbc(a: int, m: int, carry: int = 0):
+    # A - M - (1 - C) is the same as A + ~M + C
+    return adc(a, m ^ 0xFF, carry)
+
+def compare(register: int, m: int):
+    # CMP / CPX / CPY. Carry means register >= m (no borrow)
+    difference = register - m
+    return difference & 0xFF, difference >= 0
+
+def asl(value: int):
+    return (value << 1) & 0xFF, value >> 7
+
+def lsr(value: int):
+    return value >> 1, value & 0x01
+
+def rol(value: int, carry: int = 0):
+    return ((value << 1) | carry) & 0xFF, value >> 7
+
+def ror(value: int, carry: int = 0):
+    return (value >> 1) | (carry << 7), value & 0x01
+
+
+# Optional lookup table so ADC / SBC are a single index instead of arithmetic.
+# Index = carry << 16 | a << 8 | m
+# Entry = result | carry out << 8 | overflow << 9
+# SBC uses the same table with m inverted (index ^ 0xFF), see sbc() above
+ARITHMETIC_TABLE_CARRY = 0x100
+ARITHMETIC_TABLE_OVERFLOW = 0x200
+
+arithmeticTable: list[int] | None = None
+
+def buildArithmeticTable() -> list[int]:
+    # 2 x 256 x 256 entries, built once (~60ms) and shared by every CPU
+    global arithmeticTable
+    if arithmeticTable != None: return arithmeticTable
+
+    table = [0] * 0x20000
+    for carry in range(2):
+        for a in range(256):
+            base = (carry << 16) | (a << 8)
+            for m in range(256):
+                result, carryOut, overflow = adc(a, m, carry)
+                table[base | m] = result | (ARITHMETIC_TABLE_CARRY if carryOut else 0) | (ARITHMETIC_TABLE_OVERFLOW if overflow else 0)
+
+    arithmeticTable = table
+    return table
+
+
+if __name__ == "__main__":
+    # Differential check against the binary string implementation the CPU used before this module.
+    # Walks every (a, m, carry) combination and wants the exact same result and flags
+    def intToBinaryString(value: int) -> str:
+        binary: str = bin(value & 0xFF).split("0b")[1]
+        while len(binary) < 8: binary = f"0{binary}"
+        return binary
+
+    def oldCompareValues(valueA: int, valueB: int):
+        valueA1: str = intToBinaryString(valueA)
+        valueB1: str = intToBinaryString(valueB)
+
+        inverseB = ""
+        for char in valueB1: inverseB += "1" if char == "0" else "0"
+
+        negativeB = ""
+        carry = 0
+        one = "00000001"
+        for i in range(7, -1, -1):
+            r = carry
+            r += 1 if inverseB[i] == "1" else 0
+            r += 1 if one[i] == "1" else 0
+            negativeB = ('1' if r % 2 == 1 else "0") + negativeB
+            carry = 0 if r < 2 else 1
+
+        result = ""
+        carry = 0
+        for i in range(7, -1, -1):
+            r = carry
+            r += 1 if valueA1[i] == "1" else 0
+            r += 1 if negativeB[i] == "1" else 0
+            result = ('1' if r % 2 == 1 else "0") + result
+            carry = 0 if r < 2 else 1
+
+        return int(result, 2), valueA >= valueB
+
+    def oldAddWithCarry(A: int, B: int, carryFlag: bool = False):
+        carryInt: int = 1 if carryFlag else 0
+        result: int = A + B + carryInt
+        overflowFlag = ((A ^ B) & 0x80) == 0 and ((A ^ result) & 0x80) != 0
+        return result & 0xFF, result > 0xFF, overflowFlag
+
+    def oldSubtractWithCarry(A: int, B: int, carryFlag: bool = False):
+        numA: int = int(intToBinaryString(A), 2)
+        numB: int = int(intToBinaryString(B), 2)
+        carry: int = 1 if carryFlag else 0
+        result = numA - numB - (1-carry)
+        overflowFlag = False
+        if ((numA ^ numB) & 0b10000000) != 0:
+            if ((numA & 0b10000000) != (result & 0b10000000)):
+                overflowFlag = True
+        return result & 0xFF, numA >= numB + (1 - carry), overflowFlag
+
+    def oldLogicalShiftRight(A: int):
+        return A >> 1, bin(A)[-1] == "1"
+
+    def oldRotateLeft(A: int, carryFlag: bool = False):
+        carry: int = 1 if carryFlag else 0
+        newCarry: bool = bin(A).split("0b")[1].zfill(8)[0] == "1"
+        return ((A << 1) | carry) & 0xFF, newCarry
+
+    def oldRotateRight(A: int, carryFlag: bool = False):
+        carry: int = 1 if carryFlag else 0
+        return (A >> 1) | (carry << 7), A & 0x01 == 1
+
+    def oldArithmeticShiftLeft(A: int):
+        return (A << 1) & 0xFF, ((A >> 7) & 1) == 1
+
+    def flagsOf(result: int):
+        # N / Z the way the CPU reads them (from the 8 bit result)
+        return (result & 0x80) != 0, result == 0
+
+    table = buildArithmeticTable()
+    mismatches = 0
+    checked = 0
+
+    def check(name, inputs, new, old):
+        global mismatches, checked
+        checked += 1
+        newResult, oldResult = new[0], old[0]
+        same = newResult == oldResult and flagsOf(newResult) == flagsOf(oldResult)
+        same = same and all(bool(n) == bool(o) for n, o in zip(new[1:], old[1:]))
+        if not same:
+            mismatches += 1
+            if mismatches <= 10: print(f"{name}{inputs}: new {new} old {old}")
+
+    for carry in (False, True):
+        for a in range(256):
+            for m in range(256):
+                index = (carry << 16) | (a << 8) | m
+                check("adc", (a, m, carry), adc(a, m, carry), oldAddWithCarry(a, m, carry))
+                check("sbc", (a, m, carry), sbc(a, m, carry), oldSubtractWithCarry(a, m, carry))
+
+                packed = table[index]
+                check("adcTable", (a, m, carry), (packed & 0xFF, packed & ARITHMETIC_TABLE_CARRY, packed & ARITHMETIC_TABLE_OVERFLOW), oldAddWithCarry(a, m, carry))
+                packed = table[index ^ 0xFF]
+                check("sbcTable", (a, m, carry), (packed & 0xFF, packed & ARITHMETIC_TABLE_CARRY, packed & ARITHMETIC_TABLE_OVERFLOW), oldSubtractWithCarry(a, m, carry))
+
+                if carry == False:
+                    check("compare", (a, m), compare(a, m), oldCompareValues(a, m))
+
+            check("asl", (a,), asl(a), oldArithmeticShiftLeft(a))
+            check("lsr", (a,), lsr(a), oldLogicalShiftRight(a))
+            check("rol", (a, carry), rol(a, carry), oldRotateLeft(a, carry))
+            check("ror", (a, carry), ror(a, carry), oldRotateRight(a, carry))
+
+    print(f"{checked} cases checked, {mismatches} mismatches")
@@ -1,5 +1,4 @@
 import time
-from line_profiler import LineProfiler
 
 class Int:
     def __init__(self, value=0, bits=8, signed=True, overflowAllowed=True) -> None:
@@ -171,6 +170,10 @@ class Int:
         return type(self).__name__ + f"({self.value} ~ 0x{self.getHex()})"
         #return f"Value: {self.value} ; Hex: {self.getHex(True)} ; Overflow: {self.didOverflow}"
 
+def intToHex(value: int, bits: int = 8) -> str:
+    # Plain int registers -> the same zero padded upper case hex as Int.getHex()
+    return f"{value & ((1 << bits) - 1):0{bits // 4}X}"
+
 class Int8(Int):
     pass
     #def __init__(self, value=0, overflowAllowed=True) -> None:
@@ -197,6 +200,8 @@ def toProfile():
     combined |= UInt16(a.value)
 
 if __name__ == "__main__":
+    from line_profiler import LineProfiler # only for this demo, the emulator never needs it
+    
     profiler = LineProfiler()
     a: Int8 = Int8(-500, True)
     print(a.maxValueClamping, a.minValueClamping, a.offsetClamping)
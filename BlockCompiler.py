@@ -0,0 +1,158 @@
+# Basic block compiler
+# Turns a straight run of 6502 instructions (up to and including the first branch / jump / return) into
+# Python source, compiles it once and caches the function by (bank, pc).
+# Running a block skips fetch, decode, dispatch and the pc bookkeeping for every instruction inside it.
+
+# The generated code only bakes in what can't change: the opcodes, their operands and the cycle counts.
+# Registers and memory are still read when the block runs, and cpu.cycles is bumped after every
+# instruction so a PPU catch-up in the middle of a block still lands on the right cycle.
+# Interrupts are taken between blocks, so a block gives up (pc on the next instruction) as soon as the next PPU event
+# is due, the same instruction the interpreter would have stopped after to let NES.step catch the PPU up.
+
+# Cache keys use the bus page tag instead of the raw address, so a switched PRG bank never runs the
+# other bank's code. Blocks from RAM ($0000-$1FFF, $6000-$7FFF) ask the bus to watch their page and
+# are thrown away the first time that page gets written.
+
+from Opcodes import OPCODES, OpcodeSpec, IMPLIED, ACCUMULATOR, IMMEDIATE, ZEROPAGE, ZEROPAGE_X, ZEROPAGE_Y, ABSOLUTE, ABSOLUTE_X, ABSOLUTE_Y, INDIRECT_X, INDIRECT_Y
+
+# These decide where the pc goes next, they end the block (and run through the normal handler)
+BLOCK_ENDING_MNEMONICS = {"JMP", "JSR", "RTS", "RTI", "BRK", "BPL", "BMI", "BVC", "BVS", "BCC", "BCS", "BNE", "BEQ"}
+
+# Can let a waiting IRQ in, so the block stops after them and the CPU gets to check
+INTERRUPT_ENABLING_MNEMONICS = {"CLI", "PLP"}
+
+STORE_MNEMONICS = {"STA", "STX", "STY", "SAX", "INC", "DEC", "ASL", "LSR", "ROL", "ROR", "DCP", "ISB", "SLO", "RLA", "SRE", "RRA"}
+
+class BlockCompiler():
+    def __init__(self, cpu) -> None:
+        self.cpu = cpu
+        self.bus = cpu.bus
+        
+        self.blocks = {} # (page tag, pc) -> compiled block
+        self.blocksByTag = {} # page tag -> keys of the blocks compiled from that page, for invalidating
+        
+        self.compiledCount = 0
+    
+    def getBlock(self, pc: int):
+        tag = self.bus.pageTags[pc >> 8]
+        block = self.blocks.get((tag, pc))
+        if block != None: return block
+        
+        if tag == None: return None # I/O, never compiled
+        return self.compileBlock(pc, tag)
+    
+    def compileBlock(self, startPc: int, tag):
+        source, names = self.generateSource(startPc)
+        if source == None: return None
+        
+        scope = dict(names)
+        exec(compile(source, f"<block ${startPc:04X}>", "exec"), scope)
+        block = scope["block"]
+        
+        key = (tag, startPc)
+        self.blocks[key] = block
+        self.blocksByTag.setdefault(tag, []).append(key)
+        if tag[0] != "PRG": self.bus.watchCodePage(tag, self.invalidate)
+        
+        self.compiledCount += 1
+        return block
+    
+    def invalidate(self, tag):
+        for key in self.blocksByTag.pop(tag, ()):
+            del self.blocks[key]
+    
+    def invalidateRAM(self):
+        # RAM got replaced without going through the bus (a savestate), drop everything that didn't come from ROM
+        for tag in [tag for tag in self.blocksByTag if tag[0] != "PRG"]: self.invalidate(tag)
+    
+    def clear(self):
+        self.blocks = {}
+        self.blocksByTag = {}
+    
+    
+    def generateSource(self, startPc: int):
+        # Returns the source of "def block():" and the names it needs, or (None, None) if nothing can be compiled here
+        cpu = self.cpu
+        peek = self.bus.peekAddress
+        pageEnd = (startPc & 0xFF00) + 0x100
+        
+        names = {"cpu": cpu, "console": cpu.console, "read": self.bus.readAddress, "dispatch": cpu.dispatchTable}
+        lines = []
+        pc = startPc
+        endsWithHandler = False
+        
+        while True:
+            opcode = peek(pc)
+            spec: OpcodeSpec = OPCODES[opcode]
+            
+            # Unknown opcodes are left to step() (it traps), instructions hanging over the page edge are left to the next block
+            if spec == None or pc + spec.length > pageEnd: break
+            
+            if len(lines) > 0:
+                lines.append(f"    if cpu.cycles >= console.nextPPUEventCycle:")
+                lines.append(f"        cpu.pc = 0x{pc:04X}")
+                lines.append(f"        return")
+            
+            if spec.mnemonic in BLOCK_ENDING_MNEMONICS:
+                lines.append(f"    cpu.pc = 0x{(pc + 1) & 0xFFFF:04X}")
+                lines.append(f"    cpu.cycles += dispatch[0x{opcode:02X}]()")
+                endsWithHandler = True
+                break
+            
+            operand = peek(pc + 1) if spec.length > 1 else 0
+            if spec.length > 2: operand |= peek(pc + 2) << 8
+            
+            lines += self.instructionSource(spec, pc, operand, names)
+            pc += spec.length
+            
+            if spec.mnemonic in INTERRUPT_ENABLING_MNEMONICS: break
+            # A write into cartridge space can switch banks, stop so the next block is looked up in the new bank
+            if spec.mode in (ABSOLUTE, ABSOLUTE_X, ABSOLUTE_Y) and spec.mnemonic in STORE_MNEMONICS and operand >= 0x8000: break
+            if pc >= pageEnd: break
+        
+        if len(lines) == 0: return None, None
+        
+        if endsWithHandler == False: lines.append(f"    cpu.pc = 0x{pc & 0xFFFF:04X}")
+        return "def block():\n" + "\n".join(lines) + "\n", names
+    
+    def instructionSource(self, spec: OpcodeSpec, pc: int, operand: int, names: dict) -> list[str]:
+        # Same effect as dispatchTable[opcode]() with the pc sitting on the operand, but with the operand already known
+        mode = spec.mode
+        cycles = spec.cycles
+        penalty = ""
+        
+        if mode == IMPLIED or mode == ACCUMULATOR:
+            function = spec.mnemonic if mode == IMPLIED else f"Accumulator{spec.mnemonic}"
+            names[function] = getattr(self.cpu, function)
+            return [f"    {function}()", f"    cpu.cycles += {cycles}"]
+        
+        names[spec.mnemonic] = getattr(self.cpu, spec.mnemonic)
+        lines = []
+        
+        if mode == IMMEDIATE: address = f"0x{(pc + 1) & 0xFFFF:04X}"
+        elif mode == ZEROPAGE: address = f"0x{operand:02X}"
+        elif mode == ABSOLUTE: address = f"0x{operand:04X}"
+        elif mode == ZEROPAGE_X: address = f"(0x{operand:02X} + cpu.XRegister) & 0xFF"
+        elif mode == ZEROPAGE_Y: address = f"(0x{operand:02X} + cpu.YRegister) & 0xFF"
+        elif mode == ABSOLUTE_X or mode == ABSOLUTE_Y:
+            register = "XRegister" if mode == ABSOLUTE_X else "YRegister"
+            lines.append(f"    address = (0x{operand:04X} + cpu.{register}) & 0xFFFF")
+            address = "address"
+            penalty = f" + ((0x{operand:04X} ^ address) > 0xFF)"
+        elif mode == INDIRECT_X:
+            lines.append(f"    pointer = (0x{operand:02X} + cpu.XRegister) & 0xFF")
+            lines.append(f"    low = read(pointer)")
+            lines.append(f"    address = (read((pointer + 1) & 0xFF) << 8) | low")
+            address = "address"
+        elif mode == INDIRECT_Y:
+            lines.append(f"    low = read(0x{operand:02X})")
+            lines.append(f"    base = (read(0x{(operand + 1) & 0xFF:02X}) << 8) | low")
+            lines.append(f"    address = (base + cpu.YRegister) & 0xFFFF")
+            address = "address"
+            penalty = " + ((base ^ address) > 0xFF)"
+        else:
+            raise ValueError(f"Can't compile addressing mode {mode}") # INDIRECT / RELATIVE only show up on block enders
+        
+        lines.append(f"    {spec.mnemonic}({address})")
+        lines.append(f"    cpu.cycles += {cycles}{penalty if spec.pageCrossPenalty else ''}")
+        return lines
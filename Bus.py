@@ -0,0 +1,250 @@
+# CPU memory bus
+# https://www.nesdev.org/wiki/CPU_memory_map
+
+# Address range | Size  | Device
+# $0000-$07FF   | $0800 | 2KB internal RAM
+# $0800-$1FFF   | $1800 | Mirrors of $0000-$07FF
+# $2000-$2007   | $0008 | PPU registers
+# $2008-$3FFF   | $1FF8 | Mirrors of $2000-$2007 (repeats every 8 bytes)
+# $4000-$4017   | $0018 | APU and I/O registers
+# $4018-$5FFF   | $1FE8 | APU test mode / cartridge expansion
+# $6000-$7FFF   | $2000 | Cartridge PRG RAM (when present)
+# $8000-$FFFF   | $8000 | Cartridge PRG ROM + mapper registers
+
+# The 64KB address space is split into 256 pages of 256 bytes.
+# Each page is either a memoryview straight into the backing bytearray (RAM, PRG ROM, ...)
+# or None, in which case the access goes to that page's handler (PPU, I/O, mapper).
+# Reads and writes have their own tables, so a page can be read directly but written through a handler (PRG ROM, I/O)
+
+from DecodedPRG import DecodedPRG
+
+# What a read gets when nothing drives the data bus (write only registers, the status / controller bits that aren't wired).
+# On hardware it's whatever was on the bus last, usually the high byte of the address. $FF is what Nintendulator's nestest.log shows
+IO_OPEN_BUS = 0xFF
+
+class Bus:
+    def __init__(self, console) -> None:
+        self.console = console
+        
+        self.internalRAM = bytearray(0x0800)
+        self.expansion = bytearray(0x2000) # $4000-$5FFF. Holds the last value written to each APU / I/O register
+        self.prgRAM = bytearray(0x2000)
+        self.prgROM = bytearray(0x4000) # Replaced by the cartridge's PRG when one is inserted
+        
+        self.readPages: list[memoryview | None] = [None] * 256
+        self.writePages: list[memoryview | None] = [None] * 256
+        self.readHandlers = [self.openBusRead] * 256
+        self.writeHandlers = [self.ignoreWrite] * 256
+        
+        # What memory each page really is, e.g. ("RAM", 0x0100). Mirrors share a tag. None for I/O.
+        # The block compiler caches code by it
+        self.pageTags: list[tuple | None] = [None] * 256
+        self.codePageCallbacks = {} # page tag -> called on the first write to a page that has compiled code
+        
+        # (opcodes, operands, lengths) records for every page of PRG ROM, None everywhere else. See DecodedPRG
+        self.decodedPages: list[tuple | None] = [None] * 256
+        self.decodedPRG: DecodedPRG | None = None
+        
+        self.mapper = None # the cartridge's, gets every write to $8000-$FFFF
+        
+        self.mapInternalRAM()
+        self.mapPPURegisters()
+        self.mapExpansion()
+        self.mapPRGRAM()
+        self.mapPRGROM(self.prgROM)
+    
+    def mapInternalRAM(self):
+        # $0000-$1FFF, the 2KB repeats 4 times
+        ramView = memoryview(self.internalRAM)
+        for page in range(0x00, 0x20):
+            offset = (page & 0x07) << 8
+            self.readPages[page] = ramView[offset:offset + 0x100]
+            self.writePages[page] = ramView[offset:offset + 0x100]
+            self.pageTags[page] = ("RAM", offset)
+    
+    def mapPPURegisters(self):
+        # $2000-$3FFF, the PPU decodes the address itself (address & 0x2007)
+        for page in range(0x20, 0x40):
+            self.readPages[page] = None
+            self.writePages[page] = None
+            self.readHandlers[page] = self.readPPURegister
+            self.writeHandlers[page] = self.writePPURegister
+    
+    def mapExpansion(self):
+        # $4000-$5FFF. Page $40 holds the APU / I/O registers so reads and writes there go through handlers
+        expansionView = memoryview(self.expansion)
+        for page in range(0x40, 0x60):
+            offset = (page - 0x40) << 8
+            self.readPages[page] = expansionView[offset:offset + 0x100]
+            self.writePages[page] = expansionView[offset:offset + 0x100]
+        
+        self.readPages[0x40] = None
+        self.writePages[0x40] = None
+        self.readHandlers[0x40] = self.readIORegister
+        self.writeHandlers[0x40] = self.writeIORegister
+    
+    def mapPRGRAM(self):
+        # $6000-$7FFF
+        prgRAMView = memoryview(self.prgRAM)
+        for page in range(0x60, 0x80):
+            offset = (page - 0x60) << 8
+            self.readPages[page] = prgRAMView[offset:offset + 0x100]
+            self.writePages[page] = prgRAMView[offset:offset + 0x100]
+            self.pageTags[page] = ("PRGRAM", offset)
+    
+    def mapPRGROM(self, prgROM: bytearray):
+        # No mapper: the whole of $8000-$FFFF, PRG smaller than 32KB (NROM-128) is mirrored to fill it
+        self.setPRGROM(prgROM)
+        self.mapPRG(0x8000, 0x8000, 0)
+    
+    def setPRGROM(self, prgROM: bytearray):
+        # $8000-$FFFF. Writes here are meant for mapper registers, never the ROM itself.
+        # Every 256 byte page of the ROM gets its view, tag and decoded records made once here,
+        # so switching a bank (mapPRG) only copies list entries around
+        self.prgROM = prgROM
+        if self.decodedPRG == None or self.decodedPRG.prgROM is not prgROM: self.decodedPRG = DecodedPRG(prgROM)
+        
+        prgView = memoryview(prgROM)
+        offsets = range(0, len(prgROM), 0x100)
+        self.prgPageViews = [prgView[offset:offset + 0x100] for offset in offsets]
+        self.prgPageTags = [("PRG", id(prgROM), offset) for offset in offsets]
+        self.prgDecodedPages = [self.decodedPRG.page(offset) for offset in offsets]
+        
+        for page in range(0x80, 0x100):
+            self.writePages[page] = None
+            self.writeHandlers[page] = self.writeMapper
+    
+    def mapPRG(self, address: int, size: int, offset: int):
+        # Point the CPU window address -> address + size at the PRG ROM starting at offset.
+        # A window bigger than what's left of the ROM wraps around to its start
+        firstPage = address >> 8
+        pageCount = size >> 8
+        romPages = len(self.prgPageViews)
+        romPage = (offset >> 8) % romPages
+        
+        if romPage + pageCount <= romPages:
+            self.readPages[firstPage:firstPage + pageCount] = self.prgPageViews[romPage:romPage + pageCount]
+            self.pageTags[firstPage:firstPage + pageCount] = self.prgPageTags[romPage:romPage + pageCount]
+            self.decodedPages[firstPage:firstPage + pageCount] = self.prgDecodedPages[romPage:romPage + pageCount]
+            return
+        
+        for page in range(pageCount):
+            source = (romPage + page) % romPages
+            self.readPages[firstPage + page] = self.prgPageViews[source]
+            self.pageTags[firstPage + page] = self.prgPageTags[source]
+            self.decodedPages[firstPage + page] = self.prgDecodedPages[source]
+    
+    
+    def watchCodePage(self, tag, callback):
+        # Send writes to every page with this tag through writeCodePage, until the first one lands
+        self.codePageCallbacks[tag] = callback
+        for page in range(256):
+            if self.pageTags[page] == tag:
+                self.writePages[page] = None
+                self.writeHandlers[page] = self.writeCodePage
+    
+    
+    def readAddress(self, address: int) -> int:
+        memory = self.readPages[address >> 8]
+        if memory is not None: return memory[address & 0xFF]
+        return self.readHandlers[address >> 8](address)
+    
+    def writeAddress(self, address: int, value: int):
+        memory = self.writePages[address >> 8]
+        if memory is not None:
+            memory[address & 0xFF] = value
+            return
+        self.writeHandlers[address >> 8](address, value)
+    
+    def peekAddress(self, address: int) -> int:
+        # Read without side effects (no PPU status / buffer updates). For logging and debugging
+        memory = self.readPages[address >> 8]
+        if memory is not None: return memory[address & 0xFF]
+        if address >> 8 == 0x40: return self.peekIORegister(address)
+        return self.console.ppu.openBus if 0x2000 <= address <= 0x3FFF else 0
+    
+    def readSpace(self, startAddress: int, endAddress: int) -> bytearray:
+        return bytearray(self.peekAddress(address) for address in range(startAddress, endAddress))
+    
+    
+    # Handlers
+    
+    def openBusRead(self, address: int) -> int:
+        return 0
+    
+    def ignoreWrite(self, address: int, value: int):
+        pass
+    
+    def readPPURegister(self, address: int) -> int:
+        # The PPU is lazy, bring it up to the CPU before it sees the access
+        ppu = self.console.ppu
+        ppu.catchUp()
+        return ppu.readRegister(address & 0x2007)
+    
+    def writePPURegister(self, address: int, value: int):
+        ppu = self.console.ppu
+        ppu.catchUp()
+        ppu.writeRegister(address & 0x2007, value)
+    
+    def readIORegister(self, address: int) -> int:
+        # https://www.nesdev.org/wiki/2A03
+        if address == 0x4015: return IO_OPEN_BUS & 0x20 # APU status. No APU yet: nothing playing, no IRQs. Bit 5 isn't driven
+        if address == 0x4016 or address == 0x4017: return IO_OPEN_BUS & 0xE0 # controllers, none plugged in. Bits 5-7 aren't driven
+        if address < 0x4020: return IO_OPEN_BUS # write only APU registers, OAM DMA, APU test mode
+        return self.expansion[address - 0x4000] # cartridge expansion
+    
+    def peekIORegister(self, address: int) -> int:
+        # Reading $4015-$4017 has side effects (clears the frame IRQ, clocks the controller shift register), so a peek
+        # never reads the registers and shows them all as open bus, like nestest.log
+        if address < 0x4020: return IO_OPEN_BUS
+        return self.expansion[address - 0x4000]
+    
+    def writeIORegister(self, address: int, value: int):
+        # Only OAM DMA listens so far, the APU / controller registers just keep the value (savestates have it)
+        self.expansion[address - 0x4000] = value
+        if address == 0x4014: self.oamDMA(value)
+    
+    def oamDMA(self, page: int):
+        # https://www.nesdev.org/wiki/PPU_registers#OAMDMA
+        # Copies $XX00-$XXFF into OAM starting at OAMADDR (wrapping around). The CPU is halted for
+        # 513 cycles, 514 when the write lands on an odd cycle
+        ppu = self.console.ppu
+        cpu = self.console.cpu
+        ppu.catchUp()
+        
+        memory = self.readPages[page]
+        data = bytes(memory) if memory is not None else bytes(self.readAddress((page << 8) | low) for low in range(256))
+        start = ppu.oamAddress
+        ppu.oam[start:] = data[:256 - start]
+        ppu.oam[:start] = data[256 - start:]
+        
+        cpu.cycles += 513 + (cpu.cycles & 1)
+    
+    def writeCodePage(self, address: int, value: int):
+        # RAM that compiled code came from. Write it, go back to direct writes and let the compiler know
+        page = address >> 8
+        self.readPages[page][address & 0xFF] = value
+        
+        tag = self.pageTags[page]
+        for watchedPage in range(256):
+            if self.pageTags[watchedPage] == tag: self.writePages[watchedPage] = self.readPages[watchedPage]
+        self.codePageCallbacks.pop(tag)(tag)
+    
+    def writeMapper(self, address: int, value: int):
+        # Mapper registers (bank switching, IRQs, ...), see Mapper.py. Without a cartridge nothing listens
+        if self.mapper != None: self.mapper.writeRegister(address, value)
+    
+    
+    def dumpRAM(self) -> str:
+        output = ""
+        bytesPerRow = 16
+        
+        memory = self.readSpace(0x0000, 0x10000)
+        with open("ramDump.cn", "wb") as f:
+            f.write(memory)
+        
+        for i in range(len(memory)):
+            if i % bytesPerRow == 0: output += "\n"
+            output += f"{memory[i]:02X} "
+        
+        return output
@@ -1,6 +1,3 @@
-from BitwiseInts import Int8, UInt8, Int16, UInt16
-from RAM import RAM
-
 class Cartridge():
     def __init__(self, filePath: str = "") -> None:
         if filePath == "": raise FileNotFoundError # Please specify a file
@@ -24,25 +21,11 @@ class Cartridge():
         self.tvSystem1: int = 0
         self.tvSystem2: int = 0
         self.unusedBytes: bytearray = bytearray(5)
+        self.mirroring: str = "horizontal"
+        self.hasCHRRAM: bool = False
         
         self.loadFile()
     
-    def writePRGToRam(self, RAM: RAM):
-        prgAsBytes = bytes(self.PRGMemory)
-        
-        if self.prgRomChunks == 1:
-            RAM.writeSpace(UInt16(0x8000), UInt16(0xBFFF), prgAsBytes)
-            RAM.writeSpace(UInt16(0xC000), UInt16(0xFFFF), prgAsBytes)
-        elif self.prgRomChunks == 2:
-            RAM.writeSpace(UInt16(0x8000), UInt16(0xFFFF), prgAsBytes)
-    
-    def writeCHRToVram(self, VRAM: bytearray):
-        chrAsBytes = bytes(self.CHRMemory)
-        # Pattern Table 0
-        VRAM[0x0000:0x0FFF] = chrAsBytes[0x0000:0x0FFF]
-        # Pattern Table 1
-        VRAM[0x1000:0x1FFF] = chrAsBytes[0x1000:0x1FFF]
-    
     def loadFile(self):
         with open(self.filePath, "rb") as f:
             header: bytes = f.read(0x10) # read first line, 16 bytes
@@ -62,6 +45,11 @@ class Cartridge():
 
             self.mapperID = ((self.mapper2 >> 4) << 4) | (self.mapper1 >> 4)
             
+            # https://www.nesdev.org/wiki/INES#Flags_6
+            if self.mapper1 & 0x08: self.mirroring = "fourScreen"
+            elif self.mapper1 & 0x01: self.mirroring = "vertical"
+            else: self.mirroring = "horizontal"
+            
             # iNES file format (just 1 for now)
             fileType = 1
             
@@ -76,6 +64,11 @@ class Cartridge():
                 self.CHRBanks = self.chrRomChunks
                 self.CHRMemory = bytearray(self.CHRBanks * 8192)
                 f.readinto(self.CHRMemory)
+                
+                # No CHR ROM means the board has 8KB of CHR RAM instead
+                if self.CHRBanks == 0:
+                    self.hasCHRRAM = True
+                    self.CHRMemory = bytearray(8192)
             
             elif fileType == 2:
                 pass
@@ -1,18 +1,133 @@
-import os
+# Compare a CPU trace against nestest.log
+# https://www.nesdev.org/wiki/Emulator_tests (nestest.log is the reference trace from Nintendulator)
 
-with open("nestest.log.txt", "r") as f:
-    nesTestLogs = f.read().splitlines()
+# Both sides are read one line at a time, so it works just as well on a file as on
+# cpu.tracer.lines() straight from a running CPU (no text file in between).
+# Every line is split into columns and each column is compared on its own:
+#   instruction  C000  4C F5 C5  JMP $C5F5
+#   registers    A:00 X:00 Y:00 P:24 SP:FD
+#   PPU          PPU:  0, 21
+#   CYC          CYC:7
+# Every mismatch is reported (with a few lines around it), not just the first one.
 
-with open("cpuOutputLog.txt", "r") as f:
-    cpuLogs = f.read().splitlines()
+#   python CompareResults.py [ours] [reference] [--context N] [--max-reports N] [--ignore COLUMN ...] [--skip TEXT ...]
 
-#os.system("cls")
-for i in range(0, len(cpuLogs)):
-    cpuLog = cpuLogs[i].split("PPU:")[0]
-    nesTestLog = nesTestLogs[i].split("PPU:")[0]
+import argparse
+from collections import deque
+from itertools import zip_longest
+
+COLUMNS = ("instruction", "registers", "PPU", "CYC")
+
+# Lines whose reference instruction contains one of these aren't compared.
+# Nintendulator prints the unofficial NOPs' operands in its own way
+DEFAULT_SKIP_RULES = ("*NOP",)
+
+def splitColumns(line: str) -> dict:
+    # The instruction is padded to 48 characters, the rest is "A:00 X:00 Y:00 P:24 SP:FD PPU:  0, 21 CYC:7"
+    line = line.rstrip()
+    rest = line[48:]
+    registers, _, timing = rest.partition(" PPU:")
+    ppu, _, cycles = timing.partition(" CYC:")
+    return {"instruction": line[:48].rstrip(), "registers": registers.strip(), "PPU": ppu.strip(), "CYC": cycles.strip()}
+
+class Mismatch():
+    def __init__(self, lineNumber: int, ours: str, reference: str, columns: list[str], before: list) -> None:
+        self.lineNumber = lineNumber
+        self.ours = ours
+        self.reference = reference
+        self.columns = columns # the columns that differ
+        self.before = before # (line number, ours, reference) leading up to it
+        self.after = []
+    
+    def __str__(self) -> str:
+        output = f"Mismatch at line {self.lineNumber} ({', '.join(self.columns)})\n"
+        for lineNumber, ours, reference in self.before: output += f"   {lineNumber:6}  {ours}\n"
+        output += f" - {self.lineNumber:6}  {self.ours}\n"
+        output += f" + {self.lineNumber:6}  {self.reference}\n"
+        for lineNumber, ours, reference in self.after: output += f"   {lineNumber:6}  {ours}\n"
+        return output
+
+class ComparisonReport():
+    def __init__(self) -> None:
+        self.compared = 0
+        self.skipped = 0
+        self.mismatches: list[Mismatch] = []
+        self.mismatchCount = 0 # keeps counting after maxReports
+        self.columnCounts = {column: 0 for column in COLUMNS}
+        self.extraOurs = 0 # lines left over when the other side ran out
+        self.extraReference = 0
+    
+    @property
+    def passed(self) -> bool:
+        return self.mismatchCount == 0 and self.extraReference == 0
+    
+    def summary(self) -> str:
+        perColumn = ", ".join(f"{column} {count}" for column, count in self.columnCounts.items())
+        output = f"{self.compared} lines compared, {self.skipped} skipped, {self.mismatchCount} mismatched ({perColumn})"
+        if self.extraOurs: output += f"\n{self.extraOurs} extra lines in our trace"
+        if self.extraReference: output += f"\nour trace stopped {self.extraReference} lines early"
+        return output
     
-    if "*NOP" in nesTestLog: continue
-    if cpuLog == nesTestLog: continue
+    def __str__(self) -> str:
+        return "".join(f"{mismatch}\n" for mismatch in self.mismatches) + self.summary()
+
+
+def compareLogs(ours, reference, ignoreColumns=(), skipRules=DEFAULT_SKIP_RULES, context: int = 3, maxReports: int = 100) -> ComparisonReport:
+    # ours / reference: anything that gives lines (open files, tracer.lines(), lists)
+    report = ComparisonReport()
+    columns = [column for column in COLUMNS if column not in ignoreColumns]
+    before = deque(maxlen=context)
+    waitingForContext = [] # mismatches still collecting the lines after them
+    
+    for lineNumber, (ourLine, referenceLine) in enumerate(zip_longest(ours, reference), 1):
+        if ourLine == None:
+            report.extraReference += 1
+            continue
+        if referenceLine == None:
+            report.extraOurs += 1
+            continue
+        
+        ourLine = ourLine.rstrip()
+        referenceLine = referenceLine.rstrip()
+        
+        for mismatch in waitingForContext: mismatch.after.append((lineNumber, ourLine, referenceLine))
+        waitingForContext = [mismatch for mismatch in waitingForContext if len(mismatch.after) < context]
+        
+        ourColumns = splitColumns(ourLine)
+        referenceColumns = splitColumns(referenceLine)
+        if any(rule in referenceColumns["instruction"] for rule in skipRules):
+            report.skipped += 1
+        else:
+            report.compared += 1
+            different = [column for column in columns if ourColumns[column] != referenceColumns[column]]
+            if different:
+                report.mismatchCount += 1
+                for column in different: report.columnCounts[column] += 1
+                
+                if len(report.mismatches) < maxReports:
+                    mismatch = Mismatch(lineNumber, ourLine, referenceLine, different, list(before))
+                    report.mismatches.append(mismatch)
+                    if context > 0: waitingForContext.append(mismatch)
+        
+        before.append((lineNumber, ourLine, referenceLine))
+    
+    return report
+
+def compareFiles(oursPath: str, referencePath: str = "nestest.log.txt", **options) -> ComparisonReport:
+    with open(oursPath, "r") as ours, open(referencePath, "r") as reference:
+        return compareLogs(ours, reference, **options)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare a CPU trace with nestest.log")
+    parser.add_argument("ours", nargs="?", default="cpuOutputLog.txt")
+    parser.add_argument("reference", nargs="?", default="nestest.log.txt")
+    parser.add_argument("--context", type=int, default=3, help="lines shown before / after every mismatch")
+    parser.add_argument("--max-reports", type=int, default=100, help="mismatches printed in full (all of them are counted)")
+    parser.add_argument("--ignore", nargs="*", default=[], choices=COLUMNS, help="columns not compared")
+    parser.add_argument("--skip", nargs="*", default=list(DEFAULT_SKIP_RULES), help="skip lines whose reference instruction contains this")
+    arguments = parser.parse_args()
     
-    print(f"Mismatch!\n{cpuLog}\n{nesTestLog}")
-    break
\ No newline at end of file
+    report = compareFiles(arguments.ours, arguments.reference, ignoreColumns=arguments.ignore, skipRules=arguments.skip, context=arguments.context, maxReports=arguments.max_reports)
+    print(report)
+    raise SystemExit(0 if report.passed else 1)
@@ -0,0 +1,59 @@
+# Pre-decoded PRG ROM
+# ROM never changes, so every byte offset of it is decoded once when the cartridge goes in:
+# the opcode (which handler to run), the operand (0-2 bytes put together) and the instruction length.
+# They're kept in 3 parallel arrays (array module, 1-2 bytes per entry instead of a Python object each)
+# indexed by the offset into the ROM, so every bank gets its records for free.
+
+# The bus hands out one 256 entry slice per mapped page (next to readPages), so fetching an
+# instruction from ROM is one lookup instead of 1-3 bus reads and an OPCODES lookup.
+
+# Offsets where the instruction would hang over the end of a page get length 0, the next page
+# can be a different bank so the CPU reads those (and unknown opcodes) the normal way.
+
+from array import array
+from Opcodes import OPCODES
+
+LENGTH_OF_OPCODE = [spec.length if spec != None else 0 for spec in OPCODES]
+
+class DecodedPRG():
+    def __init__(self, prgROM: bytearray) -> None:
+        self.prgROM = prgROM
+        size = len(prgROM)
+        
+        self.opcodes = array("B", prgROM)
+        self.operands = array("H", bytes(size * 2))
+        self.lengths = array("B", bytes(size))
+        
+        operands = self.operands
+        lengths = self.lengths
+        for offset in range(size):
+            length = LENGTH_OF_OPCODE[prgROM[offset]]
+            if length == 0 or (offset & 0xFF) + length > 0x100: continue
+            
+            lengths[offset] = length
+            if length > 1: operands[offset] = prgROM[offset + 1]
+            if length > 2: operands[offset] |= prgROM[offset + 2] << 8
+        
+        self.opcodeView = memoryview(self.opcodes)
+        self.operandView = memoryview(self.operands)
+        self.lengthView = memoryview(self.lengths)
+    
+    def page(self, offset: int):
+        # (opcodes, operands, lengths) for the 256 bytes of ROM starting at offset
+        return (self.opcodeView[offset:offset + 0x100], self.operandView[offset:offset + 0x100], self.lengthView[offset:offset + 0x100])
+
+
+if __name__ == "__main__":
+    # Check every record against decoding the ROM by hand
+    with open("nestest.nes", "rb") as f: rom = f.read()
+    prgROM = bytearray(rom[0x10:0x10 + rom[4] * 0x4000])
+    decoded = DecodedPRG(prgROM)
+    
+    mismatches = 0
+    for offset in range(len(prgROM)):
+        spec = OPCODES[prgROM[offset]]
+        length = 0 if spec == None or (offset & 0xFF) + spec.length > 0x100 else spec.length
+        operand = int.from_bytes(prgROM[offset + 1:offset + length], "little") if length > 1 else 0
+        if (decoded.opcodes[offset], decoded.operands[offset], decoded.lengths[offset]) != (prgROM[offset], operand, length): mismatches += 1
+    
+    print(f"{len(prgROM)} offsets checked, {mismatches} mismatches")
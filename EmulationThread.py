@@ -0,0 +1,170 @@
+# Emulation thread
+# The console runs on its own thread so the window (a slow flip, dragging it around) never holds the emulation up.
+# Finished frames go to the window through a TripleBuffer without either side ever waiting on a lock:
+# the emulation thread always has a snapshot of its own to write into, the window always reads the newest
+# finished one, and neither touches the one the other is using.
+# The window controls the console by putting commands on a queue, they're carried out between frames.
+
+# Nothing here knows about pygame. onFrame is how the window gets told a frame is ready (see main.py)
+
+import queue
+import threading
+
+import numpy
+
+from FrameBuffer import FrameBuffer
+from FramePacer import FramePacer
+from Rewind import Rewind
+
+class FrameSnapshot():
+    # Everything the window shows about one frame, copied out of the console
+    def __init__(self) -> None:
+        self.number = 0 # counts up with every publish, 0 is never published
+        self.frameBuffer = FrameBuffer((256, 240))
+        self.registers = (0, 0, 0, 0, 0) # pc A X Y SP
+        self.flags = (0, 0, 0, 0, 0, 0, 0) # N V B D I Z C
+        
+        # Only filled in after a "debugViews" command, None otherwise
+        self.palettes = None # 8 lists of 4 RGB colours
+        self.patternTables = None # (table 0, table 1), 128x128 pixel values each
+
+class TripleBuffer():
+    # One writer thread, one reader thread, three slots. The writer fills `writing`, then makes it `latest`
+    # and picks a slot that's neither the latest nor the one the reader holds to write next.
+    # Every shared attribute is a single int set in one go, so no lock is needed
+    def __init__(self, makeSlot) -> None:
+        self.slots = [makeSlot() for i in range(3)]
+        self.latest = 0
+        self.writing = 1
+        self.reading = None
+    
+    def writeSlot(self):
+        return self.slots[self.writing]
+    
+    def publish(self):
+        self.latest = self.writing
+        reading = self.reading
+        self.writing = next(index for index in range(3) if index != self.latest and index != reading)
+    
+    def read(self):
+        # The newest finished slot. It stays the reader's (the writer won't touch it) until the next read
+        while True:
+            latest = self.latest
+            self.reading = latest
+            # If the writer published in between it may already be writing into the slot we just claimed, try again
+            if self.latest == latest: return self.slots[latest]
+
+class EmulationThread():
+    def __init__(self, console, onFrame=None) -> None:
+        self.console = console
+        self.onFrame = onFrame # called on the emulation thread after every publish
+        
+        self.commands = queue.Queue() # (command, arguments), see handleCommand
+        self.frames = TripleBuffer(FrameSnapshot)
+        self.published = 0
+        
+        # Last few minutes of frames, the "rewind" command steps back one
+        self.rewind = Rewind(console)
+        
+        self.paused = True
+        self.stopped = False # the CPU stopped (unknown opcode, end of nestest), nothing more will run
+        self.running = False
+        self.wantDebugViews = True # the first snapshot has them so the window has something to show
+        
+        # Real time speed (60.0988 fps), the window reads pacer.report() / achievedFPS from its own thread
+        self.pacer = FramePacer()
+        
+        self.thread = threading.Thread(target=self.run, name="Emulation", daemon=True)
+    
+    def start(self):
+        self.running = True
+        self.thread.start()
+    
+    def stop(self):
+        # From the window's thread. Waits for the frame being run to finish
+        self.send("quit")
+        self.thread.join()
+    
+    def send(self, command: str, *arguments):
+        self.commands.put((command, arguments))
+    
+    def run(self):
+        self.publish()
+        
+        while True:
+            self.handleCommands(self.paused)
+            if self.running == False: break
+            if self.paused:
+                # The time spent paused isn't owed to anything once it runs again
+                self.pacer.reset()
+                continue
+            
+            if self.console.runFrame():
+                self.rewind.capture()
+            else:
+                self.stopped = True
+                self.paused = True
+            self.publish()
+            self.pacer.waitForNextFrame()
+    
+    def handleCommands(self, wait: bool):
+        # Everything that's queued. While paused this sleeps until a command comes in
+        try:
+            command, arguments = self.commands.get(block=wait)
+            while True:
+                self.handleCommand(command, arguments)
+                command, arguments = self.commands.get(block=False)
+        except queue.Empty:
+            pass
+    
+    def handleCommand(self, command: str, arguments: tuple):
+        if command == "pause":
+            self.paused = True
+        elif command == "resume":
+            self.paused = self.stopped
+        elif command == "togglePause":
+            self.paused = self.paused == False or self.stopped
+        elif command == "step":
+            # One instruction, then stay paused
+            self.paused = True
+            if self.stopped == False and self.console.step()[0] == -1: self.stopped = True
+            self.publish()
+        elif command == "rewind":
+            if self.rewind.stepBack(): self.publish()
+        elif command == "setSpeed":
+            self.pacer.setSpeed(arguments[0])
+        elif command == "setUncapped":
+            self.pacer.setUncapped(arguments[0])
+        elif command == "debugViews":
+            self.wantDebugViews = True
+            self.publish()
+        elif command == "call":
+            # Run a function on this thread, between frames: call(console)
+            arguments[0](self.console)
+        elif command == "quit":
+            self.running = False
+        else:
+            raise ValueError(f"Unknown command {command}")
+    
+    def publish(self):
+        # Copy what the window needs into the slot being written and hand it over
+        console = self.console
+        cpu = console.cpu
+        snapshot: FrameSnapshot = self.frames.writeSlot()
+        
+        self.published += 1
+        snapshot.number = self.published
+        numpy.copyto(snapshot.frameBuffer.pixels, console.screen.pixels)
+        snapshot.registers = (cpu.pc, cpu.accumulatorRegister, cpu.XRegister, cpu.YRegister, cpu.stackPointer)
+        snapshot.flags = (cpu.negativeFlag, cpu.overflowFlag, cpu.breakFlag, cpu.decimalModeFlag, cpu.interruptDisableFlag, cpu.zeroFlag, cpu.carryFlag)
+        
+        if self.wantDebugViews:
+            snapshot.palettes = [console.ppu.getPaletteFromIndex(i, True) for i in range(8)]
+            snapshot.patternTables = (console.ppu.getPatternTable(0), console.ppu.getPatternTable(1))
+            self.wantDebugViews = False
+        else:
+            snapshot.palettes = None
+            snapshot.patternTables = None
+        
+        self.frames.publish()
+        if self.onFrame != None: self.onFrame()
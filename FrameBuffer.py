@@ -0,0 +1,119 @@
+# Framebuffer
+# 240 rows x 256 columns of NES colour indexes (0x00 -> 0x3F), one byte each.
+# The PPU writes indexes, RGB only exists once a frame when something wants to show it (toRGB)
+
+import numpy
+
+# System palette, NES colour index -> RGB
+# using 2C02 colors. First one on https://www.nesdev.org/wiki/PPU_palettes
+SYSTEM_PALETTE: list[tuple[int,int,int]] = [
+    (98,98,98), # 0x00
+    (0,31,178), # 0x01
+    (36,4,200), # 0x02
+    (82,0,178), # 0x03
+    (115,0,118), # 0x04
+    (128,0,36), # 0x05
+    (115,11,0), # 0x06
+    (82,40,0), # 0x07
+    (36,68,0), # 0x08
+    (0,87,0), # 0x09
+    (0,92,0), # 0x0A
+    (0,83,36), # 0x0B
+    (0,60,118), # 0x0C
+    (0,0,0), # 0x0D DONT USE. Results in blacker than black signal. Causes problems for some TVs
+    (0,0,0), # 0x0E
+    (0,0,0), # 0x0F
+
+    (171,171,171), # 0x10
+    (13,87,255), # 0x11
+    (75,48,255), # 0x12
+    (138,19,255), # 0x13
+    (118,8,214), # 0x14
+    (210,18,105), # 0x15
+    (199,46,0), # 0x16
+    (157,84,0), # 0x17
+    (96,123,0), # 0x18
+    (32,152,0), # 0x19
+    (0,163,0), # 0x1A
+    (0,153,66), # 0x1B
+    (0,125,180), # 0x1C
+    (0,0,0), # 0x1D
+    (0,0,0), # 0x1E
+    (0,0,0), # 0x1F
+
+    (255,255,255), # 0x20
+    (83,174,255), # 0x21
+    (144,133,255), # 0x22
+    (211,101,255), # 0x23
+    (255,87,255), # 0x24
+    (255,93,207), # 0x25
+    (255,119,87), # 0x26
+    (250,158,0), # 0x27
+    (189,199,0), # 0x28
+    (122,231,0), # 0x29
+    (67,246,17), # 0x2A
+    (38,239,126), # 0x2B
+    (44,213,246), # 0x2C
+    (78,78,78), # 0x2D
+    (0,0,0), # 0x2E
+    (0,0,0), # 0x2F
+
+    (255,255,255), # 0x30
+    (182,255,255), # 0x31
+    (206,209,255), # 0x32
+    (233,195,255), # 0x33
+    (255,188,255), # 0x34
+    (255,189,244), # 0x35
+    (255,198,195), # 0x36
+    (255,213,154), # 0x37
+    (233,230,129), # 0x38
+    (206,244,129), # 0x39
+    (182,251,154), # 0x3A
+    (169,250,195), # 0x3B
+    (169,240,244), # 0x3C
+    (184,184,184), # 0x3D
+    (0,0,0), # 0x3E
+    (0,0,0), # 0x3F
+]
+PALETTE_LUT = numpy.array(SYSTEM_PALETTE, dtype=numpy.uint8) # (64, 3)
+
+class FrameBuffer():
+    def __init__(self, size: tuple[int,int] = (256,240)) -> None:
+        self.width, self.height = size
+        
+        # pixels[y, x] = colour index. Row major so a scanline is one contiguous run of bytes
+        self.pixels = numpy.zeros((self.height, self.width), dtype=numpy.uint8)
+        self.rgb = numpy.zeros((self.height, self.width, 3), dtype=numpy.uint8)
+    
+    def setPixel(self, x: int, y: int, colorIndex: int):
+        self.pixels[y, x] = colorIndex & 0x3F
+    
+    def setScanline(self, y: int, colorIndexes):
+        # colorIndexes is anything numpy can take as 256 bytes (bytearray, list, array)
+        self.pixels[y] = colorIndexes
+    
+    def clear(self, colorIndex: int = 0x0F):
+        self.pixels.fill(colorIndex & 0x3F)
+    
+    def toRGB(self) -> numpy.ndarray:
+        # (height, width, 3) uint8. Reuses the same array every frame
+        numpy.take(PALETTE_LUT, self.pixels, axis=0, out=self.rgb, mode="clip")
+        return self.rgb
+    
+    def getBuffer(self) -> memoryview:
+        # Buffer protocol view of the colour indexes (no copy). C contiguous, width * height bytes
+        return memoryview(self.pixels)
+    
+    def getRGBBuffer(self) -> memoryview:
+        # Same but of the converted frame, width * height * 3 bytes
+        return memoryview(self.toRGB())
+
+
+if __name__ == "__main__":
+    frameBuffer = FrameBuffer()
+    for y in range(frameBuffer.height):
+        frameBuffer.setScanline(y, numpy.arange(frameBuffer.width, dtype=numpy.uint8) & 0x3F)
+    
+    print(frameBuffer.pixels.nbytes, "bytes of colour indexes")
+    print(frameBuffer.toRGB()[0, :4])
+    print(frameBuffer.getBuffer().nbytes, frameBuffer.getRGBBuffer().shape)
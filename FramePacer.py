@@ -0,0 +1,125 @@
+# Frame pacing
+# https://www.nesdev.org/wiki/Cycle_reference_chart
+# An NTSC NES doesn't run at 60 frames a second. The PPU is clocked at 21.477272 MHz / 4 and a frame is
+# 341 * 262 dots, minus one on every other frame (the skipped dot on odd frames with rendering on): 60.0988 Hz.
+
+# Deadlines come from one anchor, deadline = anchor + frames * frameNs, never "the last deadline + one frame", so
+# sleeping a little too long one frame doesn't add up, the next frame just waits less.
+# time.sleep alone wakes up late, so it sleeps until spinNs before the deadline and spins (yielding, the window's
+# thread wants the GIL) for the rest. When it's fallen more than maxLagFrames behind (a slow frame, the debugger)
+# it starts from now instead of running frames back to back to catch up.
+
+import time
+
+NTSC_FRAME_RATE = 21477272.727 / 4 / (341 * 262 - 0.5)
+SPIN_NS = 1_500_000
+REPORT_FRAMES = 60 # achievedFPS / busyFraction are worked out again every this many frames
+
+class FramePacer():
+    def __init__(self, frameRate: float = NTSC_FRAME_RATE, spinNs: int = SPIN_NS, maxLagFrames: int = 3) -> None:
+        self.frameRate = frameRate
+        self.spinNs = spinNs
+        self.maxLagFrames = maxLagFrames
+        
+        self.speed = 1.0 # 2 runs twice as fast, 0.5 half as fast
+        self.uncapped = False # fast forward, no waiting at all
+        self.frameNs = 1_000_000_000 / (frameRate * self.speed)
+        
+        # Only ever written by the thread that calls waitForNextFrame, plain floats so anything can read them
+        self.achievedFPS = 0.0
+        self.busyFraction = 0.0 # how much of the time went to emulating (everything but waiting)
+        self.droppedFrames = 0 # deadlines given up on because it was too far behind
+        
+        self.reset()
+    
+    def reset(self):
+        # Start counting from now. After a pause, a speed change or anything else that wasn't emulating
+        now = time.perf_counter_ns()
+        self.anchor = now
+        self.framesSinceAnchor = 0
+        self.frameStart = now
+        
+        self.reportStart = now
+        self.reportFrames = 0
+        self.busyNs = 0
+    
+    def setSpeed(self, speed: float):
+        if speed <= 0: raise ValueError(f"Speed has to be more than 0, not {speed}")
+        self.speed = speed
+        self.frameNs = 1_000_000_000 / (self.frameRate * speed)
+        self.reset()
+    
+    def setUncapped(self, uncapped: bool):
+        self.uncapped = uncapped
+        self.reset()
+    
+    def targetFPS(self) -> float:
+        return float("inf") if self.uncapped else self.frameRate * self.speed
+    
+    def waitForNextFrame(self):
+        # Once a frame, right after it's been emulated. Everything since the last call counts as busy
+        now = time.perf_counter_ns()
+        self.busyNs += now - self.frameStart
+        self.framesSinceAnchor += 1
+        
+        if self.uncapped == False:
+            deadline = self.anchor + int(self.framesSinceAnchor * self.frameNs)
+            if now - deadline > self.maxLagFrames * self.frameNs:
+                self.droppedFrames += 1
+                self.anchor = now
+                self.framesSinceAnchor = 0
+            elif deadline > now:
+                if deadline - now > self.spinNs: time.sleep((deadline - now - self.spinNs) / 1_000_000_000)
+                while time.perf_counter_ns() < deadline: time.sleep(0)
+        
+        self.frameStart = time.perf_counter_ns()
+        self.reportFrames += 1
+        if self.reportFrames >= REPORT_FRAMES:
+            elapsed = self.frameStart - self.reportStart
+            self.achievedFPS = self.reportFrames * 1_000_000_000 / elapsed
+            self.busyFraction = self.busyNs / elapsed
+            self.reportStart = self.frameStart
+            self.reportFrames = 0
+            self.busyNs = 0
+    
+    def isCPUBound(self) -> bool:
+        # Emulating took (nearly) all the time there was, waiting isn't what's holding it back
+        return self.busyFraction > 0.95
+    
+    def report(self) -> str:
+        target = "uncapped" if self.uncapped else f"{self.targetFPS():.2f}"
+        bound = "CPU bound" if self.isCPUBound() else "pacing bound"
+        return f"{self.achievedFPS:.2f} / {target} fps, {self.busyFraction * 100:.0f}% busy ({bound})"
+
+if __name__ == "__main__":
+    # A fake workload paced at 1x, 2x and uncapped, then one too slow for 60 fps
+    def pace(pacer: FramePacer, frames: int, workSeconds: float):
+        pacer.reset()
+        start = time.perf_counter()
+        for i in range(frames):
+            workEnd = time.perf_counter() + workSeconds
+            while time.perf_counter() < workEnd: pass
+            pacer.waitForNextFrame()
+        return frames / (time.perf_counter() - start)
+    
+    pacer = FramePacer()
+    fps = pace(pacer, 120, 0.005)
+    print(f"paced    {fps:.3f} fps (target {pacer.targetFPS():.4f}) {pacer.report()}")
+    assert abs(fps - NTSC_FRAME_RATE) < 0.2
+    
+    pacer.setSpeed(2)
+    fps = pace(pacer, 120, 0.001)
+    print(f"2x       {fps:.3f} fps {pacer.report()}")
+    assert abs(fps - NTSC_FRAME_RATE * 2) < 0.5
+    
+    pacer.setSpeed(1)
+    pacer.setUncapped(True)
+    fps = pace(pacer, 120, 0.001)
+    print(f"uncapped {fps:.3f} fps {pacer.report()}")
+    assert fps > NTSC_FRAME_RATE * 5
+    
+    pacer.setUncapped(False)
+    fps = pace(pacer, 60, 0.025)
+    print(f"slow     {fps:.3f} fps {pacer.report()}")
+    assert pacer.isCPUBound()
+    print("FramePacer OK")
@@ -0,0 +1,115 @@
+# Idle loop skipping
+# Games wait for the next frame by spinning on $2002 or on a flag the NMI handler sets, e.g.
+#   wait: LDA $2002
+#         BPL wait
+# Every trip round a loop like that reads the same memory and ends with the same registers, until
+# the PPU changes something. The PPU only changes things at its events (see PPU.EVENT_DOTS), so
+# the CPU can skip whole trips up to the next event without anything being able to tell.
+
+# A loop gets skipped when:
+#   - it's a short backwards branch in PRG ROM and everything in it only reads (loads, compares, BIT, flags, branches)
+#   - the memory it reads is RAM / ROM / $2002, nothing where a read does more than once (like $2007)
+#   - it got round twice with the exact same registers and no PPU event in between, which also gives the cycles per trip
+# Skipped trips are added to cpu.cycles, so the cycle count and everything the PPU does stays exactly the same.
+
+from Opcodes import OPCODES, OpcodeSpec, IMPLIED, IMMEDIATE, ZEROPAGE, ZEROPAGE_X, ZEROPAGE_Y, ABSOLUTE, ABSOLUTE_X, ABSOLUTE_Y, RELATIVE
+
+MAX_LOOP_LENGTH = 0x20 # bytes between the loop start and the branch back
+
+POLLING_MNEMONICS = {"LDA", "LDX", "LDY", "BIT", "CMP", "CPX", "CPY", "AND", "ORA", "EOR", "NOP", "CLC", "SEC", "CLV",
+                     "BPL", "BMI", "BVC", "BVS", "BCC", "BCS", "BNE", "BEQ"}
+
+class IdleLoopDetector():
+    def __init__(self, cpu) -> None:
+        self.cpu = cpu
+        self.bus = cpu.bus
+        
+        # (page tag, pc) -> the most cycles one trip round the loop can take, 0 when it isn't a polling loop
+        self.loops = {}
+        
+        # Never skip up to or past this CPU cycle (the next PPU event). Set by the console
+        self.cycleLimit = 0
+        
+        self.lastLoop = None
+        self.lastState = None
+        self.lastCycles = 0
+        self.lastCycleLimit = 0
+        
+        self.skippedCycles = 0
+    
+    def arrive(self):
+        # The CPU is back at the start of a loop it just branched to
+        cpu = self.cpu
+        loop = (self.bus.pageTags[cpu.pc >> 8], cpu.pc)
+        maxTripCycles = self.loops.get(loop)
+        if maxTripCycles == None:
+            maxTripCycles = self.analyzeLoop(cpu.pc)
+            self.loops[loop] = maxTripCycles
+        
+        if maxTripCycles == 0:
+            self.lastLoop = None
+            return
+        
+        state = (cpu.accumulatorRegister, cpu.XRegister, cpu.YRegister, cpu.stackPointer, cpu.nzResult, cpu.carryFlag, cpu.overflowFlag, cpu.interruptDisableFlag, cpu.decimalModeFlag)
+        # Same loop, same registers, and no PPU event in between (the limit only moves when the PPU catches up on one)
+        if loop == self.lastLoop and state == self.lastState and self.cycleLimit == self.lastCycleLimit:
+            tripCycles = cpu.cycles - self.lastCycles
+            if 0 < tripCycles <= maxTripCycles:
+                # Stop at least one whole trip short, the trip that sees the change has to run for real
+                trips = (self.cycleLimit - cpu.cycles) // tripCycles - 1
+                if trips > 0:
+                    cpu.cycles += trips * tripCycles
+                    self.skippedCycles += trips * tripCycles
+        
+        self.lastLoop = loop
+        self.lastState = state
+        self.lastCycles = cpu.cycles
+        self.lastCycleLimit = self.cycleLimit
+    
+    def forget(self):
+        # Something other than the loop ran (an interrupt), the next trip can't be compared to the last one
+        self.lastLoop = None
+    
+    def clear(self):
+        self.loops = {}
+        self.lastLoop = None
+    
+    
+    def analyzeLoop(self, startPc: int) -> int:
+        # Walks from the loop start to the branch back to it. Returns the most cycles one trip can take, 0 if it isn't a polling loop
+        tag = self.bus.pageTags[startPc >> 8]
+        if tag == None or tag[0] != "PRG": return 0 # code in RAM can change under us
+        
+        peek = self.bus.peekAddress
+        pc = startPc
+        maxCycles = 0
+        while pc - startPc < MAX_LOOP_LENGTH:
+            spec: OpcodeSpec = OPCODES[peek(pc)]
+            if spec == None or spec.mnemonic not in POLLING_MNEMONICS: return 0
+            
+            operand = peek(pc + 1) if spec.length > 1 else 0
+            if spec.length > 2: operand |= peek(pc + 2) << 8
+            if self.isPureRead(spec, operand) == False: return 0
+            
+            maxCycles += spec.cycles + (2 if spec.pageCrossPenalty else 0)
+            pc += spec.length
+            
+            if spec.mode == RELATIVE:
+                offset = operand - 0x100 if operand & 0x80 else operand
+                if (pc + offset) & 0xFFFF == startPc: return maxCycles
+        
+        return 0
+    
+    def isPureRead(self, spec: OpcodeSpec, operand: int) -> bool:
+        # True when reading the operand again and again gives the same value and changes nothing
+        mode = spec.mode
+        if mode in (IMPLIED, IMMEDIATE, ZEROPAGE, ZEROPAGE_X, ZEROPAGE_Y, RELATIVE): return True
+        if mode == ABSOLUTE: return self.isPureAddress(operand)
+        if mode == ABSOLUTE_X or mode == ABSOLUTE_Y:
+            return self.bus.pageTags[operand >> 8] != None and self.bus.pageTags[((operand + 0xFF) & 0xFFFF) >> 8] != None
+        return False # indirect pointers could go anywhere
+    
+    def isPureAddress(self, address: int) -> bool:
+        if self.bus.pageTags[address >> 8] != None: return True
+        # PPUSTATUS clears vblank / the write latch, but reading it twice in a row between PPU events reads the same
+        return 0x2000 <= address <= 0x3FFF and (address & 0x2007) == 0x2002
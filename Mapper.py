@@ -1,4 +1,432 @@
+# Mappers
+# https://www.nesdev.org/wiki/Mapper
+
+# The mapper decides which part of the cartridge the CPU sees at $8000-$FFFF and the PPU at $0000-$1FFF.
+# Nothing gets copied on a bank switch. The bus keeps a memoryview per 256 byte page and the PPU one per 1KB
+# of pattern memory, switching a bank just points those at another part of PRGMemory / CHRMemory
+# (see Bus.mapPRG and PPU.mapCHR).
+# The CPU talks to the mapper by writing to $8000-$FFFF, the bus hands those writes to writeRegister.
+
+# Every register is a small int attribute named in STATE_FIELDS, so savestates store them as one byte each.
+# updateBanks() works out every window from the registers, it runs after every register write and after loading a state.
+
 class Mapper():
-    def __init__(self, prgBanks: int = 0, chrBanks: int = 0) -> None:
-        self.prgBanks = prgBanks
-        self.chrBanks = chrBanks
\ No newline at end of file
+    STATE_FIELDS = ()
+    
+    def __init__(self, cartridge, console) -> None:
+        self.cartridge = cartridge
+        self.console = console
+        self.bus = console.bus
+        self.ppu = console.ppu
+        
+        self.prgSize = len(cartridge.PRGMemory)
+        self.chrSize = len(cartridge.CHRMemory)
+        self.chrWritable = cartridge.hasCHRRAM
+        
+        self.bus.setPRGROM(cartridge.PRGMemory)
+        self.ppu.setCHRMemory(cartridge.CHRMemory, self.chrWritable)
+        self.ppu.setMirroring(cartridge.mirroring)
+        self.ppu.scanlineCounter = None
+        
+        self.reset()
+    
+    def reset(self):
+        # Subclasses set their registers to the power on values first
+        self.updateBanks()
+    
+    def updateBanks(self):
+        pass
+    
+    def writeRegister(self, address: int, value: int):
+        pass
+    
+    
+    def mapPRG(self, address: int, size: int, bank: int):
+        # bank counts in windows of `size`, from the end when negative (-1 is the last one)
+        self.bus.mapPRG(address, size, (bank * size) % self.prgSize)
+    
+    def mapCHR(self, address: int, size: int, bank: int):
+        # The PPU has to draw everything up to now with the old banks first
+        self.ppu.catchUp()
+        self.ppu.mapCHR(address, size, (bank * size) % self.chrSize)
+    
+    def setMirroring(self, mirroring: str):
+        # Four screen boards have their own nametable RAM, the mapper's mirroring bit does nothing there
+        if mirroring == self.ppu.mirroring or self.cartridge.mirroring == "fourScreen": return
+        self.ppu.catchUp()
+        self.ppu.setMirroring(mirroring)
+    
+    
+    # Savestates, see SaveState.py. The registers, then the CHR RAM if the board has it
+    def getRegisters(self) -> list[int]:
+        return [getattr(self, name) for name in self.STATE_FIELDS]
+    
+    def setRegisters(self, values):
+        for name, value in zip(self.STATE_FIELDS, values): setattr(self, name, value)
+    
+    def saveState(self) -> bytes:
+        state = bytes(self.getRegisters())
+        if self.chrWritable: state += self.cartridge.CHRMemory
+        return state
+    
+    def loadState(self, data):
+        registerCount = len(self.getRegisters())
+        self.setRegisters(bytes(data[:registerCount]))
+        if self.chrWritable: self.cartridge.CHRMemory[:] = data[registerCount:registerCount + self.chrSize]
+        self.updateBanks()
+
+
+class NROM(Mapper):
+    # https://www.nesdev.org/wiki/NROM
+    # 16KB (mirrored) or 32KB of PRG, 8KB of CHR, no registers
+    def updateBanks(self):
+        self.mapPRG(0x8000, 0x8000, 0)
+        self.mapCHR(0x0000, 0x2000, 0)
+
+class MMC1(Mapper):
+    # https://www.nesdev.org/wiki/MMC1
+    # Registers are written one bit at a time: 5 writes to $8000-$FFFF shift a value in (bit 0 first),
+    # the address of the 5th write picks the register. $8000 control, $A000 CHR bank 0, $C000 CHR bank 1, $E000 PRG bank.
+    # A write with bit 7 set resets the shift register and goes back to PRG mode 3
+    STATE_FIELDS = ("shiftRegister", "shiftCount", "control", "chrBank0", "chrBank1", "prgBank")
+    MIRRORING = ("singleLow", "singleHigh", "vertical", "horizontal")
+    
+    def reset(self):
+        self.shiftRegister = 0
+        self.shiftCount = 0
+        self.control = 0x0C # PRG mode 3, last bank fixed at $C000
+        self.chrBank0 = 0
+        self.chrBank1 = 0
+        self.prgBank = 0
+        super().reset()
+    
+    def writeRegister(self, address: int, value: int):
+        if value & 0x80:
+            self.shiftRegister = 0
+            self.shiftCount = 0
+            self.control |= 0x0C
+            self.updateBanks()
+            return
+        
+        self.shiftRegister |= (value & 0x01) << self.shiftCount
+        self.shiftCount += 1
+        if self.shiftCount < 5: return
+        
+        value = self.shiftRegister
+        self.shiftRegister = 0
+        self.shiftCount = 0
+        
+        register = (address >> 13) & 0x03
+        if register == 0: self.control = value
+        elif register == 1: self.chrBank0 = value
+        elif register == 2: self.chrBank1 = value
+        else: self.prgBank = value
+        self.updateBanks()
+    
+    def updateBanks(self):
+        self.setMirroring(self.MIRRORING[self.control & 0x03])
+        
+        # 512KB boards (SUROM) use CHR bank 0 bit 4 to pick which 256KB half the PRG bank is in
+        outerBank = self.chrBank0 & 0x10 if self.prgSize > 0x40000 else 0
+        prgBank = outerBank | (self.prgBank & 0x0F)
+        prgMode = (self.control >> 2) & 0x03
+        if prgMode < 2: # 32KB, the low bit is ignored
+            self.mapPRG(0x8000, 0x8000, prgBank >> 1)
+        elif prgMode == 2: # first bank fixed at $8000
+            self.mapPRG(0x8000, 0x4000, outerBank)
+            self.mapPRG(0xC000, 0x4000, prgBank)
+        else: # last bank fixed at $C000
+            self.mapPRG(0x8000, 0x4000, prgBank)
+            self.mapPRG(0xC000, 0x4000, outerBank | 0x0F)
+        
+        if self.control & 0x10: # two 4KB banks
+            self.mapCHR(0x0000, 0x1000, self.chrBank0)
+            self.mapCHR(0x1000, 0x1000, self.chrBank1)
+        else: # 8KB, the low bit is ignored
+            self.mapCHR(0x0000, 0x2000, self.chrBank0 >> 1)
+
+class UxROM(Mapper):
+    # https://www.nesdev.org/wiki/UxROM
+    # Switchable 16KB at $8000, the last 16KB fixed at $C000. Usually CHR RAM
+    STATE_FIELDS = ("prgBank",)
+    
+    def reset(self):
+        self.prgBank = 0
+        super().reset()
+    
+    def writeRegister(self, address: int, value: int):
+        self.prgBank = value
+        self.updateBanks()
+    
+    def updateBanks(self):
+        self.mapPRG(0x8000, 0x4000, self.prgBank)
+        self.mapPRG(0xC000, 0x4000, -1)
+        self.mapCHR(0x0000, 0x2000, 0)
+
+class CNROM(Mapper):
+    # https://www.nesdev.org/wiki/CNROM
+    # Fixed PRG like NROM, switchable 8KB of CHR
+    STATE_FIELDS = ("chrBank",)
+    
+    def reset(self):
+        self.chrBank = 0
+        super().reset()
+    
+    def writeRegister(self, address: int, value: int):
+        self.chrBank = value
+        self.updateBanks()
+    
+    def updateBanks(self):
+        self.mapPRG(0x8000, 0x8000, 0)
+        self.mapCHR(0x0000, 0x2000, self.chrBank)
+
+class AxROM(Mapper):
+    # https://www.nesdev.org/wiki/AxROM
+    # Switchable 32KB of PRG (bits 0-2), bit 4 picks which 1KB of nametable RAM all four nametables use. CHR RAM
+    STATE_FIELDS = ("prgBank", "nametable")
+    
+    def reset(self):
+        self.prgBank = 0
+        self.nametable = 0
+        super().reset()
+    
+    def writeRegister(self, address: int, value: int):
+        self.prgBank = value & 0x07
+        self.nametable = (value >> 4) & 0x01
+        self.updateBanks()
+    
+    def updateBanks(self):
+        self.setMirroring("singleHigh" if self.nametable else "singleLow")
+        self.mapPRG(0x8000, 0x8000, self.prgBank)
+        self.mapCHR(0x0000, 0x2000, 0)
+
+class MMC3(Mapper):
+    # https://www.nesdev.org/wiki/MMC3
+    # Registers are picked by the address range and whether the address is even or odd
+    #   $8000 bank select (which of R0-R7 the next $8001 write sets, bit 6 PRG layout, bit 7 CHR layout)   $8001 bank data
+    #   $A000 mirroring   $A001 PRG RAM protect
+    #   $C000 IRQ latch   $C001 IRQ reload
+    #   $E000 IRQ disable   $E001 IRQ enable
+    # R0-R1 are 2KB CHR banks, R2-R5 1KB CHR banks, R6-R7 8KB PRG banks. The last 8KB of PRG is always at $E000
+    
+    # The IRQ counter counts rises of PPU A12, about once per rendered scanline. The PPU works out on which dots
+    # they happen and calls clockScanline() there (see PPU.a12RiseDots), while the IRQ is enabled those dots are
+    # scheduler events so the CPU sees the IRQ on the right cycle
+    STATE_FIELDS = ("bankSelect", "mirroringBit", "prgRAMProtect", "irqLatch", "irqCounter", "irqReload", "irqEnabled")
+    
+    def __init__(self, cartridge, console) -> None:
+        super().__init__(cartridge, console)
+        self.ppu.scanlineCounter = self
+    
+    def reset(self):
+        self.bankRegisters = [0, 2, 4, 5, 6, 7, 0, 1]
+        self.bankSelect = 0
+        self.mirroringBit = 0
+        self.prgRAMProtect = 0
+        self.irqLatch = 0
+        self.irqCounter = 0
+        self.irqReload = 0
+        self.irqEnabled = 0
+        super().reset()
+    
+    def getRegisters(self) -> list[int]:
+        return super().getRegisters() + self.bankRegisters
+    
+    def setRegisters(self, values):
+        super().setRegisters(values)
+        self.bankRegisters = list(values[len(self.STATE_FIELDS):])
+    
+    def writeRegister(self, address: int, value: int):
+        even = (address & 0x01) == 0
+        region = address & 0xE000
+        
+        if region == 0x8000:
+            if even: self.bankSelect = value
+            else: self.bankRegisters[self.bankSelect & 0x07] = value
+            self.updateBanks()
+        elif region == 0xA000:
+            if even:
+                self.mirroringBit = value & 0x01
+                self.updateMirroring()
+            else: self.prgRAMProtect = value
+        else:
+            # Clocks up to now still count with the old values
+            self.ppu.catchUp()
+            if region == 0xC000:
+                if even: self.irqLatch = value
+                else:
+                    self.irqCounter = 0
+                    self.irqReload = 1 # reloaded from the latch on the next clock
+            elif even:
+                # Disabling also acknowledges a pending IRQ
+                self.irqEnabled = 0
+                self.console.cpu.irqLine = False
+            else:
+                self.irqEnabled = 1
+                self.console.rescheduleEvents()
+    
+    def clockScanline(self):
+        # https://www.nesdev.org/wiki/MMC3#IRQ_Specifics (the newer behaviour, an IRQ every time it reaches 0)
+        if self.irqCounter == 0 or self.irqReload:
+            self.irqCounter = self.irqLatch
+            self.irqReload = 0
+        else:
+            self.irqCounter -= 1
+        
+        if self.irqCounter == 0 and self.irqEnabled: self.console.cpu.irqLine = True
+    
+    def updateMirroring(self):
+        self.setMirroring("horizontal" if self.mirroringBit else "vertical")
+    
+    def updateBanks(self):
+        self.updateMirroring()
+        
+        banks = self.bankRegisters
+        if self.bankSelect & 0x40: # second to last bank fixed at $8000
+            self.mapPRG(0x8000, 0x2000, -2)
+            self.mapPRG(0xC000, 0x2000, banks[6])
+        else: # second to last bank fixed at $C000
+            self.mapPRG(0x8000, 0x2000, banks[6])
+            self.mapPRG(0xC000, 0x2000, -2)
+        self.mapPRG(0xA000, 0x2000, banks[7])
+        self.mapPRG(0xE000, 0x2000, -1)
+        
+        # CHR layout bit swaps the 2KB half ($0000) and the 1KB half ($1000)
+        inversion = 0x1000 if self.bankSelect & 0x80 else 0
+        self.mapCHR(0x0000 ^ inversion, 0x0800, banks[0] >> 1)
+        self.mapCHR(0x0800 ^ inversion, 0x0800, banks[1] >> 1)
+        self.mapCHR(0x1000 ^ inversion, 0x0400, banks[2])
+        self.mapCHR(0x1400 ^ inversion, 0x0400, banks[3])
+        self.mapCHR(0x1800 ^ inversion, 0x0400, banks[4])
+        self.mapCHR(0x1C00 ^ inversion, 0x0400, banks[5])
+
+
+# iNES mapper number -> class
+MAPPERS = {
+    0: NROM,
+    1: MMC1,
+    2: UxROM,
+    3: CNROM,
+    4: MMC3,
+    7: AxROM,
+}
+
+def createMapper(cartridge, console) -> Mapper:
+    if cartridge.mapperID not in MAPPERS: raise ValueError(f"Mapper {cartridge.mapperID} isn't supported")
+    return MAPPERS[cartridge.mapperID](cartridge, console)
+
+
+if __name__ == "__main__":
+    # Fake cartridges where every 1KB of PRG / CHR starts with its own bank number, switch banks and read them back
+    from types import SimpleNamespace
+    from NES import NES
+    
+    def makeCartridge(mapperID: int, prgKB: int, chrKB: int):
+        prg = bytearray(prgKB * 1024)
+        chr = bytearray(max(chrKB, 8) * 1024)
+        for bank in range(prgKB): prg[bank * 1024] = bank
+        for bank in range(chrKB): chr[bank * 1024] = bank
+        return SimpleNamespace(mapperID=mapperID, PRGMemory=prg, CHRMemory=chr, hasCHRRAM=chrKB == 0, mirroring="vertical")
+    
+    def banks(console) -> tuple:
+        # 8KB PRG banks at $8000 / $A000 / $C000 / $E000, 1KB CHR banks at $0000-$1C00
+        prg = tuple(console.bus.readAddress(address) // 8 for address in range(0x8000, 0x10000, 0x2000))
+        chr = tuple(console.ppu.peekVRAM(address) for address in range(0x0000, 0x2000, 0x0400))
+        return prg, chr
+    
+    def writeMMC1(console, address: int, value: int):
+        for bit in range(5): console.bus.writeAddress(address, (value >> bit) & 0x01)
+    
+    failures = 0
+    def check(name: str, console, expected: tuple):
+        global failures
+        actual = banks(console)
+        if actual[0] != expected[0] or (expected[1] != None and actual[1] != expected[1]):
+            failures += 1
+            print(f"{name}: got {actual}, expected {expected}")
+    
+    console = NES()
+    console.insertCartridge(makeCartridge(0, 16, 8))
+    check("NROM-128", console, ((0, 1, 0, 1), (0, 1, 2, 3, 4, 5, 6, 7)))
+    
+    console.insertCartridge(makeCartridge(1, 256, 128))
+    check("MMC1 power on", console, ((0, 1, 30, 31), (0, 1, 2, 3, 4, 5, 6, 7)))
+    writeMMC1(console, 0x8000, 0x1F) # 4KB CHR, PRG mode 3, horizontal
+    writeMMC1(console, 0xE000, 5)
+    writeMMC1(console, 0xA000, 3)
+    writeMMC1(console, 0xC000, 9)
+    check("MMC1 banks", console, ((10, 11, 30, 31), (12, 13, 14, 15, 36, 37, 38, 39)))
+    if console.ppu.mirroring != "horizontal": failures += 1
+    
+    console.insertCartridge(makeCartridge(2, 128, 0))
+    console.bus.writeAddress(0x8000, 3)
+    check("UxROM", console, ((6, 7, 14, 15), None))
+    
+    console.insertCartridge(makeCartridge(3, 32, 32))
+    console.bus.writeAddress(0x8000, 2)
+    check("CNROM", console, ((0, 1, 2, 3), (16, 17, 18, 19, 20, 21, 22, 23)))
+    
+    console.insertCartridge(makeCartridge(7, 256, 0))
+    console.bus.writeAddress(0x8000, 0x13)
+    check("AxROM", console, ((12, 13, 14, 15), None))
+    if console.ppu.mirroring != "singleHigh": failures += 1
+    
+    console.insertCartridge(makeCartridge(4, 128, 128))
+    for register, value in enumerate([8, 10, 1, 2, 3, 4, 5, 6]):
+        console.bus.writeAddress(0x8000, register)
+        console.bus.writeAddress(0x8001, value)
+    check("MMC3", console, ((5, 6, 14, 15), (8, 9, 10, 11, 1, 2, 3, 4)))
+    console.bus.writeAddress(0x8000, 0xC0) # both layout bits
+    check("MMC3 swapped", console, ((14, 6, 5, 15), (1, 2, 3, 4, 8, 9, 10, 11)))
+    
+    # Bank registers survive a savestate
+    state = console.saveState()
+    console.bus.writeAddress(0x8000, 0x06)
+    console.bus.writeAddress(0x8001, 0)
+    console.loadState(state)
+    check("MMC3 savestate", console, ((14, 6, 5, 15), (1, 2, 3, 4, 8, 9, 10, 11)))
+    
+    # MMC3 IRQ: a program that sets the counter to 20 and keeps acknowledging / re-enabling it.
+    # Background at $0000 and sprites at $1000, so the IRQ should come every 21 scanlines just after dot 260
+    cartridge = makeCartridge(4, 128, 128)
+    program = bytes([
+        0x78,                   # E000 SEI
+        0xA9, 0x08,             # E001 LDA #$08
+        0x8D, 0x00, 0x20,       # E003 STA $2000
+        0xA9, 20,               # E006 LDA #20
+        0x8D, 0x00, 0xC0,       # E008 STA $C000
+        0x8D, 0x01, 0xC0,       # E00B STA $C001
+        0x8D, 0x01, 0xE0,       # E00E STA $E001
+        0xA9, 0x18,             # E011 LDA #$18
+        0x8D, 0x01, 0x20,       # E013 STA $2001
+        0x58,                   # E016 CLI
+        0x4C, 0x17, 0xE0,       # E017 JMP $E017
+        0x8D, 0x00, 0xE0,       # E01A STA $E000 (IRQ)
+        0x8D, 0x01, 0xE0,       # E01D STA $E001
+        0x40,                   # E020 RTI
+    ])
+    lastBank = len(cartridge.PRGMemory) - 0x2000
+    cartridge.PRGMemory[lastBank:lastBank + len(program)] = program
+    cartridge.PRGMemory[-6:] = bytes([0x00, 0xE0, 0x00, 0xE0, 0x1A, 0xE0]) # NMI, reset, IRQ vectors
+    
+    console.insertCartridge(cartridge)
+    irqs = []
+    while len(irqs) < 8:
+        console.step()
+        if console.cpu.pc == 0xE01A:
+            console.ppu.catchUp()
+            irqs.append((console.ppu.scanline, console.ppu.cycle))
+    
+    # The first one depends on where in the frame rendering got switched on
+    for (lastScanline, lastDot), (scanline, dot) in zip(irqs[1:], irqs[2:]):
+        if scanline > lastScanline and (scanline - lastScanline != 21 or not 260 <= dot <= 260 + 14 * 3 * 2):
+            failures += 1
+            print(f"MMC3 IRQ at scanline {scanline} dot {dot}, the one before was at {lastScanline}")
+    
+    # 8x16 sprites take the slow way, with every sprite off screen all 8 slots fetch tile $FF from $1000 like 8x8 sprites at $1000
+    console.ppu.oam[:] = bytes([0xFF] * 256)
+    for ctrl, expected in ((0x20, [260]), (0x30, [])):
+        console.ppu.ctrl = ctrl
+        if console.ppu.a12RiseDots(10) != expected: failures += 1
+    
+    print("mappers OK" if failures == 0 else f"{failures} mapper checks failed")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from CPU_Ricoh2A03 import Ricoh2A03
+from Bus import Bus
+from PPU import PPU
+from Cartridge import Cartridge
+from Mapper import Mapper, createMapper
+from FrameBuffer import FrameBuffer
+import SaveState
+
+# The console without any window. main.py puts a pygame frontend on top of it, Nestest.py runs it headless.
+# Nothing here (or anything it imports) needs pygame, only the standard library and numpy
+#   python NES.py game.nes [--frames N]   runs N frames as fast as it can and prints how long it took
+
+class NES():
+    def __init__(self) -> None:
+        self.bus = Bus(self) # 64 KB address space, see Bus.py for the map
+        
+        # CPU cycle the PPU has to be caught up by (next vblank / frame edge)
+        self.nextPPUEventCycle = 0
+        
+        self.screen: FrameBuffer = FrameBuffer((256,240))
+        self.cartridge: Cartridge = None
+        self.mapper: Mapper = None
+        self.ppu: PPU = PPU(self)
+        self.cpu: Ricoh2A03 = Ricoh2A03(self)
+    
+    def reset(self):
+        self.cpu.reset()
+        self.nextPPUEventCycle = 0
+        #self.ppu.reset()
+    
+    def loadROM(self, romData):
+        self.mapper = None
+        self.bus.mapper = None
+        self.ppu.scanlineCounter = None
+        self.cpu.loadRom(romData)
+        
+        self.reset()
+    
+    def insertCartridge(self, cartridge: Cartridge):
+        self.cartridge = cartridge
+        self.mapper = createMapper(cartridge, self) # maps the PRG / CHR, see Mapper.py
+        self.bus.mapper = self.mapper
+        
+        self.reset()
+    
+    def step(self):
+        # One whole CPU instruction. The PPU only runs when it has something to do (see PPU.catchUp)
+        cpuResponse = self.cpu.step()
+        if cpuResponse == -1: return (-1, 0, 0)
+        
+        if self.cpu.cycles >= self.nextPPUEventCycle:
+            self.ppu.catchUp()
+            self.nextPPUEventCycle = self.cpu.cycles + self.ppu.cpuCyclesUntilNextEvent()
+            self.cpu.idleLoop.cycleLimit = self.nextPPUEventCycle
+        
+        return (cpuResponse, 0, 0)
+    
+    # Running more than one instruction. Frontends call these and only get control back at the end,
+    # so nothing of theirs runs between instructions
+    def runFrame(self) -> bool:
+        # Up to the end of the next frame (ppu.frameComplete is left set). False if the CPU stopped first
+        ppu = self.ppu
+        step = self.step
+        ppu.frameComplete = False
+        while ppu.frameComplete == False:
+            if step()[0] == -1: return False
+        return True
+    
+    def runFrames(self, frames: int = 1) -> int:
+        # Returns how many frames it finished (fewer if the CPU stopped)
+        for finished in range(frames):
+            if self.runFrame() == False: return finished
+        return frames
+    
+    def runUntil(self, predicate) -> bool:
+        # Step until predicate(console) is true, it's checked after every instruction. False if the CPU stopped first
+        step = self.step
+        while predicate(self) == False:
+            if step()[0] == -1: return False
+        return True
+    
+    def rescheduleEvents(self):
+        # Something moved the next event closer (a mapper IRQ got switched on), have step() catch the PPU up and work it out again
+        self.nextPPUEventCycle = self.cpu.cycles
+        self.cpu.idleLoop.cycleLimit = self.nextPPUEventCycle
+    
+    # Savestates, see SaveState.py
+    def saveState(self, compress: bool = False) -> bytes:
+        return SaveState.saveState(self, compress)
+    
+    def loadState(self, data: bytes):
+        SaveState.loadState(self, data)
+    
+    def saveStateToFile(self, path: str, compress: bool = True):
+        SaveState.saveStateToFile(self, path, compress)
+    
+    def loadStateFromFile(self, path: str):
+        SaveState.loadStateFromFile(self, path)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Run a ROM without a window")
+    parser.add_argument("rom")
+    parser.add_argument("--frames", type=int, default=600)
+    arguments = parser.parse_args()
+    
+    console = NES()
+    console.insertCartridge(Cartridge(arguments.rom))
+    
+    start = time.perf_counter()
+    frames = console.runFrames(arguments.frames)
+    seconds = time.perf_counter() - start
+    print(f"{frames} frames, {console.cpu.cycles} cycles in {seconds:.2f}s ({frames / seconds:.1f} frames/s)")
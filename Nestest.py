@@ -0,0 +1,92 @@
+# Headless nestest
+# https://www.qmtpro.com/~nes/misc/nestest.txt
+
+# Runs nestest.nes in its "automation" mode: start at $C000 instead of the reset vector, no PPU needed.
+# When it's done it returns (RTS) to the address reset() left on the stack and we stop there.
+# The results are in zero page:
+#   $0002 official opcodes, $0003 unofficial opcodes. 0x00 means every test passed, anything else is the failing test's code
+# Never touches pygame / PIL, this is the quick check to run after changing anything in the CPU
+
+#   python Nestest.py [rom] [--compare [reference log]]
+
+import argparse
+import sys
+import time
+
+from NES import NES
+from Cartridge import Cartridge
+from CompareResults import compareLogs
+from Tracer import Tracer
+
+NESTEST_OFFICIAL_RESULT = 0x0002
+NESTEST_UNOFFICIAL_RESULT = 0x0003
+MAX_INSTRUCTIONS = 100000 # nestest takes 8991, anything past this is stuck
+
+class NestestResult():
+    def __init__(self, officialResult: int, unofficialResult: int, finished: bool, stopAddress: int, instructions: int, cycles: int, seconds: float, tracer: Tracer | None) -> None:
+        self.officialResult = officialResult
+        self.unofficialResult = unofficialResult
+        self.finished = finished # got back to the sentinel address (instead of trapping / running too long)
+        self.stopAddress = stopAddress
+        self.instructions = instructions
+        self.cycles = cycles
+        self.seconds = seconds
+        self.tracer = tracer
+    
+    @property
+    def passed(self) -> bool:
+        return self.finished and self.officialResult == 0x00 and self.unofficialResult == 0x00
+    
+    @property
+    def instructionsPerSecond(self) -> float:
+        return self.instructions / self.seconds if self.seconds > 0 else 0.0
+    
+    def __str__(self) -> str:
+        status = "PASSED" if self.passed else "FAILED"
+        output = f"nestest {status}: official ${self.officialResult:02X}, unofficial ${self.unofficialResult:02X}\n"
+        if self.finished == False: output += f"stopped at ${self.stopAddress:04X} before reaching the end\n"
+        output += f"{self.instructions} instructions, {self.cycles} cycles in {self.seconds:.3f}s ({self.instructionsPerSecond:,.0f} instructions/s)"
+        return output
+
+def runNestest(romPath: str = "nestest.nes", trace: bool = False) -> NestestResult:
+    console = NES()
+    cpu = console.cpu
+    cpu.nestestWithoutPPU = True
+    # Nestest runs almost every instruction once, compiling blocks would cost more than it saves.
+    # Without blocks every step() is exactly one instruction
+    cpu.useBlockCompiler = False
+    if trace: cpu.startTrace()
+    
+    console.insertCartridge(Cartridge(romPath))
+    
+    instructions = 0
+    startTime = time.perf_counter()
+    while instructions < MAX_INSTRUCTIONS:
+        if cpu.step() == -1: break
+        instructions += 1
+    seconds = time.perf_counter() - startTime
+    
+    bus = console.bus
+    return NestestResult(
+        bus.peekAddress(NESTEST_OFFICIAL_RESULT), bus.peekAddress(NESTEST_UNOFFICIAL_RESULT),
+        cpu.pc == cpu.nestestWithoutPPUStopAddress, cpu.pc,
+        instructions, cpu.cycles, seconds, cpu.tracer
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run nestest.nes without a window")
+    parser.add_argument("rom", nargs="?", default="nestest.nes")
+    parser.add_argument("--compare", nargs="?", const="nestest.log.txt", metavar="REFERENCE", help="trace the run and compare it with nestest.log")
+    arguments = parser.parse_args()
+    
+    result = runNestest(arguments.rom, trace=arguments.compare != None)
+    print(result)
+    
+    if arguments.compare != None:
+        with open(arguments.compare, "r") as reference:
+            report = compareLogs(result.tracer.lines(), reference, context=2, maxReports=10)
+        print(report)
+        if report.passed == False: sys.exit(1)
+    
+    sys.exit(0 if result.passed else 1)
@@ -0,0 +1,304 @@
+# Opcode table for the Ricoh 2A03 (6502 without decimal mode)
+# https://www.nesdev.org/wiki/CPU_unofficial_opcodes
+# https://www.masswerk.at/6502/6502_instruction_set.html
+
+# One row per opcode. Everything that needs to know about an instruction
+# (the CPU dispatch table, the disassembler, the tracer) reads it from here
+# instead of poking at the handler functions.
+
+# Addressing modes
+IMPLIED = "Implied"
+ACCUMULATOR = "Accumulator"
+IMMEDIATE = "Immediate"
+ZEROPAGE = "Zeropage"
+ZEROPAGE_X = "ZeropageX"
+ZEROPAGE_Y = "ZeropageY"
+ABSOLUTE = "Absolute"
+ABSOLUTE_X = "AbsoluteX"
+ABSOLUTE_Y = "AbsoluteY"
+INDIRECT = "Indirect"
+INDIRECT_X = "IndirectX"
+INDIRECT_Y = "IndirectY"
+RELATIVE = "Relative"
+
+class OpcodeSpec():
+    def __init__(self, opcode: int, mnemonic: str, mode: str, length: int, cycles: int, pageCrossPenalty: bool, illegal: bool) -> None:
+        self.opcode = opcode
+        self.mnemonic = mnemonic
+        self.mode = mode
+        self.length = length # bytes, including the opcode itself
+        self.cycles = cycles # base clock cycles
+        self.pageCrossPenalty = pageCrossPenalty # +1 cycle when the effective address crosses a page (or a branch is taken)
+        self.illegal = illegal
+
+    def __repr__(self) -> str:
+        return f"OpcodeSpec(${self.opcode:02X} {self.mnemonic} {self.mode})"
+
+# (opcode, mnemonic, mode, length, cycles, pageCrossPenalty, illegal)
+OPCODE_ROWS = [
+    (0x00, "BRK", IMPLIED, 1, 7, False, False),
+    (0x01, "ORA", INDIRECT_X, 2, 6, False, False),
+    (0x05, "ORA", ZEROPAGE, 2, 3, False, False),
+    (0x06, "ASL", ZEROPAGE, 2, 5, False, False),
+    (0x08, "PHP", IMPLIED, 1, 3, False, False),
+    (0x09, "ORA", IMMEDIATE, 2, 2, False, False),
+    (0x0A, "ASL", ACCUMULATOR, 1, 2, False, False),
+    (0x0D, "ORA", ABSOLUTE, 3, 4, False, False),
+    (0x0E, "ASL", ABSOLUTE, 3, 6, False, False),
+
+    (0x10, "BPL", RELATIVE, 2, 2, True, False),
+    (0x11, "ORA", INDIRECT_Y, 2, 5, True, False),
+    (0x15, "ORA", ZEROPAGE_X, 2, 4, False, False),
+    (0x16, "ASL", ZEROPAGE_X, 2, 6, False, False),
+    (0x18, "CLC", IMPLIED, 1, 2, False, False),
+    (0x19, "ORA", ABSOLUTE_Y, 3, 4, True, False),
+    (0x1D, "ORA", ABSOLUTE_X, 3, 4, True, False),
+    (0x1E, "ASL", ABSOLUTE_X, 3, 7, False, False),
+
+    (0x20, "JSR", ABSOLUTE, 3, 6, False, False),
+    (0x21, "AND", INDIRECT_X, 2, 6, False, False),
+    (0x24, "BIT", ZEROPAGE, 2, 3, False, False),
+    (0x25, "AND", ZEROPAGE, 2, 3, False, False),
+    (0x26, "ROL", ZEROPAGE, 2, 5, False, False),
+    (0x28, "PLP", IMPLIED, 1, 4, False, False),
+    (0x29, "AND", IMMEDIATE, 2, 2, False, False),
+    (0x2A, "ROL", ACCUMULATOR, 1, 2, False, False),
+    (0x2C, "BIT", ABSOLUTE, 3, 4, False, False),
+    (0x2D, "AND", ABSOLUTE, 3, 4, False, False),
+    (0x2E, "ROL", ABSOLUTE, 3, 6, False, False),
+
+    (0x30, "BMI", RELATIVE, 2, 2, True, False),
+    (0x31, "AND", INDIRECT_Y, 2, 5, True, False),
+    (0x35, "AND", ZEROPAGE_X, 2, 4, False, False),
+    (0x36, "ROL", ZEROPAGE_X, 2, 6, False, False),
+    (0x38, "SEC", IMPLIED, 1, 2, False, False),
+    (0x39, "AND", ABSOLUTE_Y, 3, 4, True, False),
+    (0x3D, "AND", ABSOLUTE_X, 3, 4, True, False),
+    (0x3E, "ROL", ABSOLUTE_X, 3, 7, False, False),
+
+    (0x40, "RTI", IMPLIED, 1, 6, False, False),
+    (0x41, "EOR", INDIRECT_X, 2, 6, False, False),
+    (0x45, "EOR", ZEROPAGE, 2, 3, False, False),
+    (0x46, "LSR", ZEROPAGE, 2, 5, False, False),
+    (0x48, "PHA", IMPLIED, 1, 3, False, False),
+    (0x49, "EOR", IMMEDIATE, 2, 2, False, False),
+    (0x4A, "LSR", ACCUMULATOR, 1, 2, False, False),
+    (0x4C, "JMP", ABSOLUTE, 3, 3, False, False),
+    (0x4D, "EOR", ABSOLUTE, 3, 4, False, False),
+    (0x4E, "LSR", ABSOLUTE, 3, 6, False, False),
+
+    (0x50, "BVC", RELATIVE, 2, 2, True, False),
+    (0x51, "EOR", INDIRECT_Y, 2, 5, True, False),
+    (0x55, "EOR", ZEROPAGE_X, 2, 4, False, False),
+    (0x56, "LSR", ZEROPAGE_X, 2, 6, False, False),
+    (0x58, "CLI", IMPLIED, 1, 2, False, False),
+    (0x59, "EOR", ABSOLUTE_Y, 3, 4, True, False),
+    (0x5D, "EOR", ABSOLUTE_X, 3, 4, True, False),
+    (0x5E, "LSR", ABSOLUTE_X, 3, 7, False, False),
+
+    (0x60, "RTS", IMPLIED, 1, 6, False, False),
+    (0x61, "ADC", INDIRECT_X, 2, 6, False, False),
+    (0x65, "ADC", ZEROPAGE, 2, 3, False, False),
+    (0x66, "ROR", ZEROPAGE, 2, 5, False, False),
+    (0x68, "PLA", IMPLIED, 1, 4, False, False),
+    (0x69, "ADC", IMMEDIATE, 2, 2, False, False),
+    (0x6A, "ROR", ACCUMULATOR, 1, 2, False, False),
+    (0x6C, "JMP", INDIRECT, 3, 5, False, False),
+    (0x6D, "ADC", ABSOLUTE, 3, 4, False, False),
+    (0x6E, "ROR", ABSOLUTE, 3, 6, False, False),
+
+    (0x70, "BVS", RELATIVE, 2, 2, True, False),
+    (0x71, "ADC", INDIRECT_Y, 2, 5, True, False),
+    (0x75, "ADC", ZEROPAGE_X, 2, 4, False, False),
+    (0x76, "ROR", ZEROPAGE_X, 2, 6, False, False),
+    (0x78, "SEI", IMPLIED, 1, 2, False, False),
+    (0x79, "ADC", ABSOLUTE_Y, 3, 4, True, False),
+    (0x7D, "ADC", ABSOLUTE_X, 3, 4, True, False),
+    (0x7E, "ROR", ABSOLUTE_X, 3, 7, False, False),
+
+    (0x81, "STA", INDIRECT_X, 2, 6, False, False),
+    (0x84, "STY", ZEROPAGE, 2, 3, False, False),
+    (0x85, "STA", ZEROPAGE, 2, 3, False, False),
+    (0x86, "STX", ZEROPAGE, 2, 3, False, False),
+    (0x88, "DEY", IMPLIED, 1, 2, False, False),
+    (0x8A, "TXA", IMPLIED, 1, 2, False, False),
+    (0x8C, "STY", ABSOLUTE, 3, 4, False, False),
+    (0x8D, "STA", ABSOLUTE, 3, 4, False, False),
+    (0x8E, "STX", ABSOLUTE, 3, 4, False, False),
+
+    (0x90, "BCC", RELATIVE, 2, 2, True, False),
+    (0x91, "STA", INDIRECT_Y, 2, 6, False, False),
+    (0x94, "STY", ZEROPAGE_X, 2, 4, False, False),
+    (0x95, "STA", ZEROPAGE_X, 2, 4, False, False),
+    (0x96, "STX", ZEROPAGE_Y, 2, 4, False, False),
+    (0x98, "TYA", IMPLIED, 1, 2, False, False),
+    (0x99, "STA", ABSOLUTE_Y, 3, 5, False, False),
+    (0x9A, "TXS", IMPLIED, 1, 2, False, False),
+    (0x9D, "STA", ABSOLUTE_X, 3, 5, False, False),
+
+    (0xA0, "LDY", IMMEDIATE, 2, 2, False, False),
+    (0xA1, "LDA", INDIRECT_X, 2, 6, False, False),
+    (0xA2, "LDX", IMMEDIATE, 2, 2, False, False),
+    (0xA4, "LDY", ZEROPAGE, 2, 3, False, False),
+    (0xA5, "LDA", ZEROPAGE, 2, 3, False, False),
+    (0xA6, "LDX", ZEROPAGE, 2, 3, False, False),
+    (0xA8, "TAY", IMPLIED, 1, 2, False, False),
+    (0xA9, "LDA", IMMEDIATE, 2, 2, False, False),
+    (0xAA, "TAX", IMPLIED, 1, 2, False, False),
+    (0xAC, "LDY", ABSOLUTE, 3, 4, False, False),
+    (0xAD, "LDA", ABSOLUTE, 3, 4, False, False),
+    (0xAE, "LDX", ABSOLUTE, 3, 4, False, False),
+
+    (0xB0, "BCS", RELATIVE, 2, 2, True, False),
+    (0xB1, "LDA", INDIRECT_Y, 2, 5, True, False),
+    (0xB4, "LDY", ZEROPAGE_X, 2, 4, False, False),
+    (0xB5, "LDA", ZEROPAGE_X, 2, 4, False, False),
+    (0xB6, "LDX", ZEROPAGE_Y, 2, 4, False, False),
+    (0xB8, "CLV", IMPLIED, 1, 2, False, False),
+    (0xB9, "LDA", ABSOLUTE_Y, 3, 4, True, False),
+    (0xBA, "TSX", IMPLIED, 1, 2, False, False),
+    (0xBC, "LDY", ABSOLUTE_X, 3, 4, True, False),
+    (0xBD, "LDA", ABSOLUTE_X, 3, 4, True, False),
+    (0xBE, "LDX", ABSOLUTE_Y, 3, 4, True, False),
+
+    (0xC0, "CPY", IMMEDIATE, 2, 2, False, False),
+    (0xC1, "CMP", INDIRECT_X, 2, 6, False, False),
+    (0xC4, "CPY", ZEROPAGE, 2, 3, False, False),
+    (0xC5, "CMP", ZEROPAGE, 2, 3, False, False),
+    (0xC6, "DEC", ZEROPAGE, 2, 5, False, False),
+    (0xC8, "INY", IMPLIED, 1, 2, False, False),
+    (0xC9, "CMP", IMMEDIATE, 2, 2, False, False),
+    (0xCA, "DEX", IMPLIED, 1, 2, False, False),
+    (0xCC, "CPY", ABSOLUTE, 3, 4, False, False),
+    (0xCD, "CMP", ABSOLUTE, 3, 4, False, False),
+    (0xCE, "DEC", ABSOLUTE, 3, 6, False, False),
+
+    (0xD0, "BNE", RELATIVE, 2, 2, True, False),
+    (0xD1, "CMP", INDIRECT_Y, 2, 5, True, False),
+    (0xD5, "CMP", ZEROPAGE_X, 2, 4, False, False),
+    (0xD6, "DEC", ZEROPAGE_X, 2, 6, False, False),
+    (0xD8, "CLD", IMPLIED, 1, 2, False, False),
+    (0xD9, "CMP", ABSOLUTE_Y, 3, 4, True, False),
+    (0xDD, "CMP", ABSOLUTE_X, 3, 4, True, False),
+    (0xDE, "DEC", ABSOLUTE_X, 3, 7, False, False),
+
+    (0xE0, "CPX", IMMEDIATE, 2, 2, False, False),
+    (0xE1, "SBC", INDIRECT_X, 2, 6, False, False),
+    (0xE4, "CPX", ZEROPAGE, 2, 3, False, False),
+    (0xE5, "SBC", ZEROPAGE, 2, 3, False, False),
+    (0xE6, "INC", ZEROPAGE, 2, 5, False, False),
+    (0xE8, "INX", IMPLIED, 1, 2, False, False),
+    (0xE9, "SBC", IMMEDIATE, 2, 2, False, False),
+    (0xEA, "NOP", IMPLIED, 1, 2, False, False),
+    (0xEC, "CPX", ABSOLUTE, 3, 4, False, False),
+    (0xED, "SBC", ABSOLUTE, 3, 4, False, False),
+    (0xEE, "INC", ABSOLUTE, 3, 6, False, False),
+
+    (0xF0, "BEQ", RELATIVE, 2, 2, True, False),
+    (0xF1, "SBC", INDIRECT_Y, 2, 5, True, False),
+    (0xF5, "SBC", ZEROPAGE_X, 2, 4, False, False),
+    (0xF6, "INC", ZEROPAGE_X, 2, 6, False, False),
+    (0xF8, "SED", IMPLIED, 1, 2, False, False),
+    (0xF9, "SBC", ABSOLUTE_Y, 3, 4, True, False),
+    (0xFD, "SBC", ABSOLUTE_X, 3, 4, True, False),
+    (0xFE, "INC", ABSOLUTE_X, 3, 7, False, False),
+
+    # ILLEGAL OPCODES
+    (0xA3, "LAX", INDIRECT_X, 2, 6, False, True),
+    (0xA7, "LAX", ZEROPAGE, 2, 3, False, True),
+    (0xAF, "LAX", ABSOLUTE, 3, 4, False, True),
+    (0xB3, "LAX", INDIRECT_Y, 2, 5, True, True),
+    (0xB7, "LAX", ZEROPAGE_Y, 2, 4, False, True),
+    (0xBF, "LAX", ABSOLUTE_Y, 3, 4, True, True),
+
+    (0x83, "SAX", INDIRECT_X, 2, 6, False, True),
+    (0x87, "SAX", ZEROPAGE, 2, 3, False, True),
+    (0x8F, "SAX", ABSOLUTE, 3, 4, False, True),
+    (0x97, "SAX", ZEROPAGE_Y, 2, 4, False, True),
+
+    (0xC3, "DCP", INDIRECT_X, 2, 8, False, True),
+    (0xC7, "DCP", ZEROPAGE, 2, 5, False, True),
+    (0xCF, "DCP", ABSOLUTE, 3, 6, False, True),
+    (0xD3, "DCP", INDIRECT_Y, 2, 8, False, True),
+    (0xD7, "DCP", ZEROPAGE_X, 2, 6, False, True),
+    (0xDB, "DCP", ABSOLUTE_Y, 3, 7, False, True),
+    (0xDF, "DCP", ABSOLUTE_X, 3, 7, False, True),
+
+    (0xE3, "ISB", INDIRECT_X, 2, 8, False, True),
+    (0xE7, "ISB", ZEROPAGE, 2, 5, False, True),
+    (0xEF, "ISB", ABSOLUTE, 3, 6, False, True),
+    (0xF3, "ISB", INDIRECT_Y, 2, 8, False, True),
+    (0xF7, "ISB", ZEROPAGE_X, 2, 6, False, True),
+    (0xFB, "ISB", ABSOLUTE_Y, 3, 7, False, True),
+    (0xFF, "ISB", ABSOLUTE_X, 3, 7, False, True),
+
+    (0x03, "SLO", INDIRECT_X, 2, 8, False, True),
+    (0x07, "SLO", ZEROPAGE, 2, 5, False, True),
+    (0x0F, "SLO", ABSOLUTE, 3, 6, False, True),
+    (0x13, "SLO", INDIRECT_Y, 2, 8, False, True),
+    (0x17, "SLO", ZEROPAGE_X, 2, 6, False, True),
+    (0x1B, "SLO", ABSOLUTE_Y, 3, 7, False, True),
+    (0x1F, "SLO", ABSOLUTE_X, 3, 7, False, True),
+
+    (0x23, "RLA", INDIRECT_X, 2, 8, False, True),
+    (0x27, "RLA", ZEROPAGE, 2, 5, False, True),
+    (0x2F, "RLA", ABSOLUTE, 3, 6, False, True),
+    (0x33, "RLA", INDIRECT_Y, 2, 8, False, True),
+    (0x37, "RLA", ZEROPAGE_X, 2, 6, False, True),
+    (0x3B, "RLA", ABSOLUTE_Y, 3, 7, False, True),
+    (0x3F, "RLA", ABSOLUTE_X, 3, 7, False, True),
+
+    (0x43, "SRE", INDIRECT_X, 2, 8, False, True),
+    (0x47, "SRE", ZEROPAGE, 2, 5, False, True),
+    (0x4F, "SRE", ABSOLUTE, 3, 6, False, True),
+    (0x53, "SRE", INDIRECT_Y, 2, 8, False, True),
+    (0x57, "SRE", ZEROPAGE_X, 2, 6, False, True),
+    (0x5B, "SRE", ABSOLUTE_Y, 3, 7, False, True),
+    (0x5F, "SRE", ABSOLUTE_X, 3, 7, False, True),
+
+    (0x63, "RRA", INDIRECT_X, 2, 8, False, True),
+    (0x67, "RRA", ZEROPAGE, 2, 5, False, True),
+    (0x6F, "RRA", ABSOLUTE, 3, 6, False, True),
+    (0x73, "RRA", INDIRECT_Y, 2, 8, False, True),
+    (0x77, "RRA", ZEROPAGE_X, 2, 6, False, True),
+    (0x7B, "RRA", ABSOLUTE_Y, 3, 7, False, True),
+    (0x7F, "RRA", ABSOLUTE_X, 3, 7, False, True),
+
+    (0xEB, "SBC", IMMEDIATE, 2, 2, False, True),
+
+    (0x1A, "NOP", IMPLIED, 1, 2, False, True),
+    (0x3A, "NOP", IMPLIED, 1, 2, False, True),
+    (0x5A, "NOP", IMPLIED, 1, 2, False, True),
+    (0x7A, "NOP", IMPLIED, 1, 2, False, True),
+    (0xDA, "NOP", IMPLIED, 1, 2, False, True),
+    (0xFA, "NOP", IMPLIED, 1, 2, False, True),
+
+    (0x80, "NOP", IMMEDIATE, 2, 2, False, True),
+    (0x82, "NOP", IMMEDIATE, 2, 2, False, True),
+    (0x89, "NOP", IMMEDIATE, 2, 2, False, True),
+    (0xC2, "NOP", IMMEDIATE, 2, 2, False, True),
+    (0xE2, "NOP", IMMEDIATE, 2, 2, False, True),
+    (0x04, "NOP", ZEROPAGE, 2, 3, False, True),
+    (0x44, "NOP", ZEROPAGE, 2, 3, False, True),
+    (0x64, "NOP", ZEROPAGE, 2, 3, False, True),
+    (0x14, "NOP", ZEROPAGE_X, 2, 4, False, True),
+    (0x34, "NOP", ZEROPAGE_X, 2, 4, False, True),
+    (0x54, "NOP", ZEROPAGE_X, 2, 4, False, True),
+    (0x74, "NOP", ZEROPAGE_X, 2, 4, False, True),
+    (0xD4, "NOP", ZEROPAGE_X, 2, 4, False, True),
+    (0xF4, "NOP", ZEROPAGE_X, 2, 4, False, True),
+
+    (0x0C, "NOP", ABSOLUTE, 3, 4, False, True),
+    (0x1C, "NOP", ABSOLUTE_X, 3, 4, True, True),
+    (0x3C, "NOP", ABSOLUTE_X, 3, 4, True, True),
+    (0x5C, "NOP", ABSOLUTE_X, 3, 4, True, True),
+    (0x7C, "NOP", ABSOLUTE_X, 3, 4, True, True),
+    (0xDC, "NOP", ABSOLUTE_X, 3, 4, True, True),
+    (0xFC, "NOP", ABSOLUTE_X, 3, 4, True, True),
+]
+
+# 256 slots indexed by opcode byte. None means the opcode is unknown (it goes to the trap handler)
+OPCODES: list[OpcodeSpec | None] = [None] * 256
+for row in OPCODE_ROWS:
+    OPCODES[row[0]] = OpcodeSpec(*row)
+del row
@@ -1,9 +1,10 @@
-from RAM import RAM
-from BitwiseInts import Int8, UInt8, UInt16
-from Screen import WriteableScreen
+from FrameBuffer import FrameBuffer, SYSTEM_PALETTE
+from TileCache import TileCache
 from Cartridge import Cartridge
 
 import copy
+import numpy
+from bisect import bisect_left
 
 # Power Up Memory
 # https://www.nesdev.org/wiki/PPU_power_up_state
@@ -16,139 +17,370 @@ import copy
 # Mirrors of PPU registers
 #   0x2008 -> 0x3FFF | Repeat every 8 bytes
 
+# Timing (NTSC)
+# https://www.nesdev.org/wiki/PPU_rendering
+#   341 dots per scanline, 262 scanlines per frame (-1 is the pre-render line, 241 -> 260 is vblank)
+#   3 dots per CPU cycle
+# The PPU doesn't run dot by dot. It sleeps until the CPU touches $2000-$2007 or the next event is due,
+# then catches up in one go. frameDot is the next dot to run, counted from the start of the pre-render line
+DOTS_PER_SCANLINE = 341
+SCANLINES_PER_FRAME = 262
+DOTS_PER_FRAME = DOTS_PER_SCANLINE * SCANLINES_PER_FRAME
+
+# Events, as the dot they happen on
+VBLANK_CLEAR_DOT = 1 # scanline -1, dot 1
+SCROLL_RELOAD_DOT = 304 # scanline -1, dot 257 copies the horizontal scroll from t to v, dots 280 -> 304 the vertical
+VBLANK_SET_DOT = (241 + 1) * DOTS_PER_SCANLINE + 1 # scanline 241, dot 1
+FRAME_END_DOT = DOTS_PER_FRAME - 1 # scanline 260, dot 340
+
+# Every visible scanline (0 -> 239) is drawn in one go at dot 256, when the real PPU has fetched its last pixel
+RENDER_DOT = 256
+VISIBLE_SCANLINES = 240
+RENDER_DOTS = [(scanline + 1) * DOTS_PER_SCANLINE + RENDER_DOT for scanline in range(VISIBLE_SCANLINES)]
+
+EVENT_DOTS = sorted([VBLANK_CLEAR_DOT, SCROLL_RELOAD_DOT, VBLANK_SET_DOT, FRAME_END_DOT] + RENDER_DOTS)
+
+# Nametable mirroring. $2000, $2400, $2800, $2C00 -> which 1KB of nametable memory they really use
+# https://www.nesdev.org/wiki/Mirroring#Nametable_Mirroring
+NAMETABLE_MIRRORING = {
+    "horizontal": (0, 0, 1, 1),
+    "vertical": (0, 1, 0, 1),
+    "singleLow": (0, 0, 0, 0),
+    "singleHigh": (1, 1, 1, 1),
+    "fourScreen": (0, 1, 2, 3),
+}
+
+# Scanline counters (MMC3) count rises of PPU address line A12, the $1000 bit of pattern table fetches.
+# https://www.nesdev.org/wiki/MMC3#IRQ_Specifics
+# Nothing is fetched dot by dot here, but which table every fetch of a scanline uses is known from PPUCTRL
+# (and OAM for 8x16 sprites), so the rises are worked out once per scanline (see a12RiseDots).
+# Each pattern fetch puts its address out on these dots of the line (and keeps it for 2 dots):
+BACKGROUND_FETCH_DOTS = [tile * 8 + dot for tile in range(32) for dot in (4, 6)]
+SPRITE_FETCH_DOTS = [(260 + slot * 8, 262 + slot * 8) for slot in range(8)]
+PREFETCH_DOTS = [324, 326, 332, 334] # first 2 tiles of the next line
+A12_LOW_DOTS = 10 # A12 has to stay low for about 3 CPU cycles before a rise counts, the gaps between tiles are too short
+
+# Tile columns fetched for one scanline (32 on screen + 1 for the fine X scroll)
+BACKGROUND_COLUMNS = numpy.arange(33)
+
 class PPU:
     def __init__(self, console) -> None:
         self.console = console
-        self.ram: RAM = self.console.ram
+        
+        # The cartridge's scanline counter (MMC3), clocked on A12 rises. Set by the mapper
+        self.scanlineCounter = None
         
         self.reset()
         
-        self.screen: WriteableScreen = self.console.screen
+        self.screen: FrameBuffer = self.console.screen
         self.frameComplete = False
         
-        # Pygame colors
-        # using 2C02 colors. First one on https://www.nesdev.org/wiki/PPU_palettes
-        self.colors = {
-            0x00: (98,98,98),
-            0x01: (0,31,178),
-            0x02: (36,4,200),
-            0x03: (82,0,178),
-            0x04: (115,0,118),
-            0x05: (128,0,36),
-            0x06: (115,11,0),
-            0x07: (82,40,0),
-            0x08: (36,68,0),
-            0x09: (0,87,0),
-            0x0A: (0,92,0),
-            0x0B: (0,83,36),
-            0x0C: (0,60,118),
-            0x0D: (0,0,0), # DONT USE. Results in blacker than black signal. Causes problems for some TVs
-            0x0E: (0,0,0),
-            0x0F: (0,0,0),
+        # Colour index -> RGB, see FrameBuffer.py
+        self.colors = SYSTEM_PALETTE
+        
+        self.setMirroring("horizontal")
+    
+    def catchUp(self):
+        # Run up to where the CPU is. Called by the bus before any PPU register access and by the NES when an event is due
+        targetDot = self.console.cpu.cycles * 3
+        if targetDot > self.dots: self.run(targetDot - self.dots)
+    
+    def run(self, dots: int):
+        self.dots += dots
+        
+        while dots > 0:
+            frameDot = self.frameDot
+            event = EVENT_DOTS[bisect_left(EVENT_DOTS, frameDot)]
             
-            0x10: (171,171,171),
-            0x11: (13,87,255),
-            0x12: (75,48,255),
-            0x13: (138,19,255),
-            0x14: (118,8,214),
-            0x15: (210,18,105),
-            0x16: (199,46,0),
-            0x17: (157,84,0),
-            0x18: (96,123,0),
-            0x19: (32,152,0),
-            0x1A: (0,163,0),
-            0x1B: (0,153,66),
-            0x1C: (0,125,180),
-            0x1D: (0,0,0),
-            0x1E: (0,0,0),
-            0x1F: (0,0,0),
+            # The mapper's scanline counter gets clocked on its own dots
+            clockDot = self.nextA12Dot(frameDot) if self.scanlineCounter != None else None
+            if clockDot != None and clockDot < event: event = clockDot
             
-            0x20: (255,255,255),
-            0x21: (83,174,255),
-            0x22: (144,133,255),
-            0x23: (211,101,255),
-            0x24: (255,87,255),
-            0x25: (255,93,207),
-            0x26: (255,119,87),
-            0x27: (250,158,0),
-            0x28: (189,199,0),
-            0x29: (122,231,0),
-            0x2A: (67,246,17),
-            0x2B: (38,239,126),
-            0x2C: (44,213,246),
-            0x2D: (78,78,78),
-            0x2E: (0,0,0),
-            0x2F: (0,0,0),
+            if frameDot + dots <= event:
+                # Doesn't reach the next event, just move along
+                self.frameDot = frameDot + dots
+                break
             
-            0x30: (255,255,255),
-            0x31: (182,255,255),
-            0x32: (206,209,255),
-            0x33: (233,195,255),
-            0x34: (255,188,255),
-            0x35: (255,189,244),
-            0x36: (255,198,195),
-            0x37: (255,213,154),
-            0x38: (233,230,129),
-            0x39: (206,244,129),
-            0x3A: (182,251,154),
-            0x3B: (169,250,195),
-            0x3C: (169,240,244),
-            0x3D: (184,184,184),
-            0x3E: (0,0,0),
-            0x3F: (0,0,0),
-        }
-    
-    def step(self):
-        if self.scanline == -1 and self.cycle == 1:
+            dots -= event + 1 - frameDot
+            self.frameDot = event + 1
+            if event == clockDot: self.scanlineCounter.clockScanline()
+            else: self.runEvent(event)
+        
+        self.scanline = self.frameDot // DOTS_PER_SCANLINE - 1
+        self.cycle = self.frameDot % DOTS_PER_SCANLINE
+    
+    def runEvent(self, event: int):
+        if event < VBLANK_SET_DOT and event > SCROLL_RELOAD_DOT:
+            self.renderScanline(event // DOTS_PER_SCANLINE - 1)
+        
+        elif event == VBLANK_CLEAR_DOT:
             self.vblank = 0
+            self.spriteZeroHit = 0
+            self.spriteOverflow = 0
             self.updateStatusRegister()
         
-        if self.scanline == 241 and self.cycle == 1:
+        elif event == SCROLL_RELOAD_DOT:
+            # Both copies in one go, line 0 starts from t's coarse X / nametable X as well as its Y
+            if self.mask & 0x18:
+                self.vramAddress = (self.vramAddress & 0x7BE0) | (self.tempVramAddress & 0x041F)
+                self.vramAddress = (self.vramAddress & 0x041F) | (self.tempVramAddress & 0x7BE0)
+        
+        elif event == VBLANK_SET_DOT:
             self.vblank = 1
-            # if control.enableMNI:
-            #   self.nmi = 1
             self.updateStatusRegister()
+            if self.ctrl & 0x80: self.console.cpu.nmiPending = True
+        
+        else:
+            self.frameDot = 0
+            self.frameComplete = True
+    
+    def cpuCyclesUntilNextEvent(self) -> int:
+        # How long the CPU can run before the PPU has to catch up again (rounded up to whole CPU cycles)
+        frameDot = self.frameDot
+        event = EVENT_DOTS[bisect_left(EVENT_DOTS, frameDot)]
+        
+        # Counter clocks only have to be on time while they can fire an IRQ, otherwise they get run whenever the PPU catches up
+        if self.scanlineCounter != None and self.scanlineCounter.irqEnabled:
+            clockDot = self.nextA12Dot(frameDot)
+            if clockDot != None and clockDot < event: event = clockDot
+        
+        return (event + 1 - frameDot + 2) // 3
+    
+    
+    # Scanline counter clocks (A12 rises), see A12_LOW_DOTS
+    
+    def nextA12Dot(self, frameDot: int) -> int | None:
+        # The first frame dot from frameDot on where A12 rises. Only looks at this line and the next,
+        # there's always an event before anything further away so it gets asked again by then
+        if (self.mask & 0x18) == 0: return None
+        
+        line = frameDot // DOTS_PER_SCANLINE # 0 is the pre-render line
+        for line in (line, line + 1):
+            if line > VISIBLE_SCANLINES: return None
+            lineStart = line * DOTS_PER_SCANLINE
+            for dot in self.a12RiseDots(line - 1):
+                if lineStart + dot >= frameDot: return lineStart + dot
+        return None
+    
+    def a12RiseDots(self, scanline: int) -> list[int]:
+        # Dots of a rendered scanline (-1 -> 239) where A12 rises after being low long enough
+        if (self.mask & 0x18) == 0 or scanline >= VISIBLE_SCANLINES: return []
+        
+        backgroundHigh = (self.ctrl & 0x10) != 0
+        if (self.ctrl & 0x20) == 0:
+            # 8x8 sprites, every sprite fetch uses the same table. The usual setups:
+            #   background $0000, sprites $1000 -> one rise at dot 260, the first sprite fetch
+            #   background $1000, sprites $0000 -> one rise at dot 324, the first fetch for the next line
+            #   the same table for both -> A12 never stays low long enough (or never goes high)
+            spriteHigh = (self.ctrl & 0x08) != 0
+            if backgroundHigh == spriteHigh: return []
+            return [324] if backgroundHigh else [260]
+        
+        # 8x16 sprites pick their table with bit 0 of the tile number, so every sprite slot can be different.
+        # Go through the whole line's fetches the slow way
+        fetches = [(dot, backgroundHigh) for dot in BACKGROUND_FETCH_DOTS]
+        for slot, spriteHigh in enumerate(self.spriteFetchTables(scanline)):
+            fetches += [(dot, spriteHigh) for dot in SPRITE_FETCH_DOTS[slot]]
+        fetches += [(dot, backgroundHigh) for dot in PREFETCH_DOTS]
+        
+        lastHigh = PREFETCH_DOTS[-1] - DOTS_PER_SCANLINE if backgroundHigh else -DOTS_PER_SCANLINE # the end of the line before
+        rises = []
+        for dot, high in fetches:
+            if high == False: continue
+            if dot - (lastHigh + 2) >= A12_LOW_DOTS: rises.append(dot)
+            lastHigh = dot
+        return rises
+    
+    def spriteFetchTables(self, scanline: int) -> list[bool]:
+        # Whether each of the 8 sprite fetches on this line (for the sprites of the next one) reads $1000-$1FFF. 8x16 sprites only.
+        # Empty slots fetch tile $FF, which is in $1000
+        oam = self.oamArray
+        rows = scanline - oam[:, 0].astype(numpy.int16)
+        onLine = numpy.flatnonzero((rows >= 0) & (rows < 16))[:8]
+        tables = [bool(oam[spriteIndex, 1] & 0x01) for spriteIndex in onLine]
+        return tables + [True] * (8 - len(tables))
+    
+    
+    # Rendering
+    # https://www.nesdev.org/wiki/PPU_scrolling
+    # v (vramAddress) while rendering:  yyy NN YYYYY XXXXX
+    #   fine Y, nametable select, coarse Y, coarse X. Fine X lives in its own register
+    
+    def renderScanline(self, scanline: int):
+        if (self.mask & 0x18) == 0:
+            # Rendering off, the screen is the backdrop colour
+            self.screen.setScanline(scanline, self.vram[0x3F00] & 0x3F)
+            return
+        
+        backgroundPixels, backgroundColors = self.renderBackground()
+        colors = self.renderSprites(scanline, backgroundPixels, backgroundColors)
+        
+        if self.mask & 0x01: colors &= 0x30 # Greyscale
+        self.screen.setScanline(scanline, colors)
+        
+        self.incrementScrollY()
+        # dot 257, horizontal scroll gets reloaded from t
+        self.vramAddress = (self.vramAddress & 0x7BE0) | (self.tempVramAddress & 0x041F)
+    
+    def renderBackground(self):
+        # Returns the pixel values (0-3, 0 is transparent) and the colour indexes for the 256 pixels of the line
+        paletteRAM = self.vramArray[0x3F00:0x3F20]
+        if (self.mask & 0x08) == 0:
+            return numpy.zeros(256, dtype=numpy.uint8), numpy.full(256, paletteRAM[0], dtype=numpy.uint8)
+        
+        v = self.vramAddress
+        coarseY = (v >> 5) & 0x1F
+        fineY = v >> 12
+        
+        # Coarse X walks across into the next nametable horizontally
+        columns = (v & 0x1F) + BACKGROUND_COLUMNS
+        nametables = ((v >> 10) & 0x02) | ((((v >> 10) & 0x01) + (columns >> 5)) & 0x01)
+        columns &= 0x1F
+        nametableBases = 0x2000 | (self.nametableMapArray[nametables] << 10)
         
-        # Some fake noise for now
-        self.screen.setPixel(self.cycle - 1, self.scanline, (255,255,255))
+        tileNumbers = self.vramArray[nametableBases | (coarseY << 5) | columns]
+        attributes = self.vramArray[nametableBases | 0x03C0 | ((coarseY >> 2) << 3) | (columns >> 2)]
+        palettes = (attributes >> (((coarseY & 0x02) << 1) | (columns & 0x02))) & 0x03
         
-        #print(f"{self.cycle-1} / 341 ; {self.scanline} / 261 ; {341*261}")
+        patternTable = 256 if self.ctrl & 0x10 else 0
+        self.tileCache.refresh()
+        pixels = self.tileCache.tiles[self.tileCache.tileMap[patternTable + tileNumbers], fineY].reshape(33 * 8)[self.fineX : self.fineX + 256]
+        palettes = numpy.repeat(palettes, 8)[self.fineX : self.fineX + 256]
         
-        self.cycle += 1
-        if self.cycle >= 341:
-            self.cycle = 0
-            self.scanline += 1
+        if (self.mask & 0x02) == 0: pixels[:8] = 0 # left 8 pixels hidden
+        
+        colors = paletteRAM[numpy.where(pixels == 0, 0, (palettes << 2) | pixels)]
+        return pixels, colors
+    
+    def renderSprites(self, scanline: int, backgroundPixels, backgroundColors):
+        # Sprite evaluation: the first 8 sprites in OAM that cover this line
+        # https://www.nesdev.org/wiki/PPU_sprite_evaluation
+        colors = backgroundColors & 0x3F
+        if (self.mask & 0x10) == 0: return colors
+        
+        spriteHeight = 16 if self.ctrl & 0x20 else 8
+        oam = self.oamArray
+        rows = scanline - (oam[:, 0].astype(numpy.int16) + 1) # OAM Y is one line early
+        onLine = numpy.flatnonzero((rows >= 0) & (rows < spriteHeight))
+        if len(onLine) > 8: self.spriteOverflow = 1
+        onLine = onLine[:8]
+        if len(onLine) == 0:
+            self.updateStatusRegister()
+            return colors
+        
+        self.tileCache.refresh()
+        tiles = self.tileCache.tiles
+        tileMap = self.tileCache.tileMap
+        paletteRAM = self.vramArray[0x3F00:0x3F20]
+        
+        # 8 pixels of padding on the right so sprites hanging off the edge don't need clipping
+        spritePixels = numpy.zeros(264, dtype=numpy.uint8)
+        spriteColors = numpy.zeros(264, dtype=numpy.uint8)
+        spriteBehind = numpy.zeros(264, dtype=numpy.bool_)
+        
+        # Lowest OAM index wins, so draw backwards and let the earlier sprites paint over the later ones
+        for spriteIndex in onLine[::-1]:
+            y, tileNumber, attributes, x = oam[spriteIndex].tolist()
+            row = int(rows[spriteIndex])
+            if attributes & 0x80: row = spriteHeight - 1 - row # flip vertically
+            
+            if spriteHeight == 16:
+                tile = ((tileNumber & 0x01) << 8) | (tileNumber & 0xFE) | (row >> 3)
+            else:
+                tile = (256 if self.ctrl & 0x08 else 0) | tileNumber
+            
+            pixels = tiles[tileMap[tile], row & 0x07]
+            if attributes & 0x40: pixels = pixels[::-1] # flip horizontally
             
-            if self.scanline >= 261:
-                self.scanline = -1
-                self.frameComplete = True
-        
-        return 0
-    
-    
-    def getPatternTable(self, tableIndex, paletteIndex):
-        patternTable = []
-        
-        for tileY in range(0, 16):
-            for tileX in range(0, 16):
-                offset = tileY * 256 + tileX * 16
-                
-                for row in range(0, 8):
-                    lsb = self.readVRAM(tableIndex * 0x1000 + offset + row + 0)
-                    msb = self.readVRAM(tableIndex * 0x1000 + offset + row + 8)
-                    
-                    tile = []
-                    
-                    for col in range(7, -1, -1): # 8 -> 0 (we're going from l->r but 0 -> 8 is l<-r)
-                        pixel = (lsb & 0x01) + (msb & 0x01)
-                        lsb >>= 1
-                        msb >>= 1
-                        tile.append(pixel)
+            opaque = pixels != 0
+            area = slice(x, x + 8)
+            spritePixels[area] = numpy.where(opaque, pixels, spritePixels[area])
+            spriteColors[area] = numpy.where(opaque, paletteRAM[0x10 | ((attributes & 0x03) << 2) | pixels], spriteColors[area])
+            spriteBehind[area] = numpy.where(opaque, (attributes & 0x20) != 0, spriteBehind[area])
+            
+            if spriteIndex == 0 and self.mask & 0x08:
+                # Sprite 0 hit: an opaque sprite 0 pixel over an opaque background pixel (never on x = 255)
+                spriteZero = numpy.zeros(264, dtype=numpy.bool_)
+                spriteZero[area] = opaque
+                hits = spriteZero[:255] & (backgroundPixels[:255] != 0)
+                if (self.mask & 0x06) != 0x06: hits[:8] = False # left 8 pixels clipped
+                if hits.any(): self.spriteZeroHit = 1
+        
+        spritePixels = spritePixels[:256]
+        if (self.mask & 0x04) == 0: spritePixels[:8] = 0 # left 8 pixels hidden
+        
+        showSprite = (spritePixels != 0) & ((spriteBehind[:256] == False) | (backgroundPixels == 0))
+        colors = numpy.where(showSprite, spriteColors[:256], colors) & 0x3F
+        
+        self.updateStatusRegister()
+        return colors
+    
+    def incrementScrollY(self):
+        # https://www.nesdev.org/wiki/PPU_scrolling#Wrapping_around
+        v = self.vramAddress
+        if (v & 0x7000) != 0x7000:
+            self.vramAddress = v + 0x1000
+            return
+        
+        v &= 0x0FFF
+        coarseY = (v >> 5) & 0x1F
+        if coarseY == 29:
+            coarseY = 0
+            v ^= 0x0800 # next nametable down
+        elif coarseY == 31:
+            coarseY = 0
+        else:
+            coarseY += 1
+        self.vramAddress = (v & 0x7C1F) | (coarseY << 5)
+    
+    def setMirroring(self, mirroring: str):
+        self.mirroring = mirroring
+        self.nametableMap = NAMETABLE_MIRRORING[mirroring]
+        self.nametableMapArray = numpy.array(self.nametableMap, dtype=numpy.int32) # for the renderer
+    
+    def setCHRMemory(self, chrMemory, writable: bool):
+        # The cartridge's CHR ROM / RAM. $0000-$1FFF is 8 windows of 1KB into it, mappers move them with mapCHR
+        self.chrMemory = chrMemory
+        self.chrWritable = writable
+        chrView = memoryview(chrMemory)
+        self.chrBankViews = [chrView[offset:offset + 0x400] for offset in range(0, len(chrMemory), 0x400)]
+        self.chrPages: list[memoryview] = [None] * 8
+        self.chrOffsets = [0] * 8 # where each window starts in chrMemory
+        
+        self.tileCache = TileCache(chrMemory)
+        self.mapCHR(0x0000, 0x2000, 0)
+    
+    def mapCHR(self, address: int, size: int, offset: int):
+        # Point address -> address + size of the pattern tables at the CHR starting at offset (1KB steps, wraps around)
+        firstWindow = address >> 10
+        for window in range(size >> 10):
+            bank = ((offset >> 10) + window) % len(self.chrBankViews)
+            self.chrPages[firstWindow + window] = self.chrBankViews[bank]
+            self.chrOffsets[firstWindow + window] = bank << 10
+            self.tileCache.mapBank(firstWindow + window, bank << 10)
+    
+    def peekVRAM(self, address: int) -> int:
+        # One byte of PPU memory, the pattern tables come through the CHR windows
+        address &= 0x3FFF
+        if address < 0x2000: return self.chrPages[address >> 10][address & 0x03FF]
+        return self.vram[self.mirrorAddress(address)]
+    
+    def mirrorAddress(self, address: int) -> int:
+        # PPU address -> where it really lives in self.vram ($0000-$1FFF is only used when there's no cartridge)
+        address &= 0x3FFF
+        if address < 0x2000: return address
+        if address < 0x3F00: return 0x2000 | (self.nametableMap[(address >> 10) & 0x03] << 10) | (address & 0x03FF)
+        return 0x3F00 | (address & 0x1F)
+    
+    
+    def getPatternTable(self, tableIndex):
+        # 128x128 pixel values (0-3), see TileCache.getPatternTable
+        return self.tileCache.getPatternTable(tableIndex)
     
     def getColorFromPalette(self, paletteIndex, pixel):
         address = 0x3F00 + (paletteIndex << 2) + pixel
-        colorHex = self.readVRAM(address)
-        return self.colors[colorHex]
+        colorHex = self.vram[address]
+        return self.colors[colorHex & 0x3F]
           
     def getPaletteFromIndex(self, paletteIndex, colorTuple=False) -> list:
         paletteStart = 0x3F00
@@ -159,7 +391,7 @@ class PPU:
         palette = []
         for i in range(4):
             address = paletteStart + 1 + (paletteIndex*4) + i
-            valueAtAddress = self.vram[address]
+            valueAtAddress = self.vram[address] & 0x3F # palette entries are 6 bits
             if colorTuple:
                 palette.append(self.colors[valueAtAddress])
             else:
@@ -170,11 +402,14 @@ class PPU:
     
     
     
-    def mirrorRegisters(self):
-        dataToMirror = self.ram.readSpace(UInt16(0x2000), UInt16(0x2007)) # 8 bytes
-        for newAddressStart in range(UInt16(0x2008).value, UInt16(0x3FFF).value, Int8(0x8).value):
-            selfOffsetAddress: UInt16 = UInt16(newAddressStart) + 0x8
-            self.ram.writeSpace(UInt16(newAddressStart), selfOffsetAddress, dataToMirror)
+    def readRegister(self, register) -> int:
+        # The bus hands over $2000-$2007 (mirrors already folded down)
+        if register == 0x2002: return self.readStatusRegister()
+        if register == 0x2004: return self.oam[self.oamAddress]
+        if register == 0x2007: return self.readVRAM()
+        
+        # Write only registers read back whatever was last put on the PPU's data bus
+        return self.openBus
     
     def readStatusRegister(self) -> int:
         value = self.status
@@ -186,83 +421,112 @@ class PPU:
         return value
     
     def readVRAM(self):
-        address = self.address
-        data = self.ppuDataBuffer
-        self.ppuDataBuffer = self.vram[address]
-        
-        # Palette gets read instantly
-        if address >= 0x3F00 and address <= 0x3F20: # 0x3F1F
-            # dont increment if we're reading from the palette
-            if address > 0x3F00: self.address -= 1
+        address = self.vramAddress & 0x3FFF # PPU address space is 14 bits
+        
+        if address >= 0x3F00:
+            # Palette gets read instantly, the buffer gets the nametable byte "underneath" it
+            data = self.peekVRAM(address)
+            self.ppuDataBuffer = self.peekVRAM(address - 0x1000)
+        else:
             data = self.ppuDataBuffer
-
-        self.address += 1
+            self.ppuDataBuffer = self.peekVRAM(address)
+        
+        self.incrementVramAddress()
         return data
     
     def writeVRAM(self, data):
-        address = self.address
-        if address >= 0x3F00 and address <= 0x3F1F:
+        address = self.vramAddress & 0x3FFF
+        if address >= 0x3F00:
             mirroredAddress = address & 0x3F1F
             self.vram[mirroredAddress] = data
             if mirroredAddress in [0x3F00, 0x3F04, 0x3F08, 0x3F0C]:
                 self.vram[mirroredAddress + 0x10] = data
             elif mirroredAddress in [0x3F10, 0x3F14, 0x3F18, 0x3F1C]:
                 self.vram[mirroredAddress - 0x10] = data
+        elif address < 0x2000:
+            if self.chrWritable == False: return # CHR ROM
+            window = address >> 10
+            self.chrPages[window][address & 0x03FF] = data
+            self.tileCache.invalidateAddress(self.chrOffsets[window] | (address & 0x03FF))
         else:
-            self.vram[address] = data
+            self.vram[self.mirrorAddress(address)] = data
+    
+    def incrementVramAddress(self):
+        # PPUCTRL bit 2: going across (+1) or down (+32)
+        self.vramAddress = (self.vramAddress + (32 if self.ctrl & 0x04 else 1)) & 0x7FFF
     
-    def writeRegister(self, register, value, mirrorRegisters: bool = False, fromRAM: bool = False):
+    def writeRegister(self, register, value):
+        # https://www.nesdev.org/wiki/PPU_registers
+        # t (tempVramAddress) / x (fineX) / w (writeToggle) as in https://www.nesdev.org/wiki/PPU_scrolling
+        self.openBus = value
+        
         if register == 0x2000:
+            # Turning NMIs on during vblank fires one straight away
+            if self.vblank and (self.ctrl & 0x80) == 0 and (value & 0x80):
+                self.console.cpu.nmiPending = True
+                self.console.rescheduleEvents() # a compiled block stops here so the NMI is taken after this instruction
             self.ctrl = value
+            self.tempVramAddress = (self.tempVramAddress & 0x73FF) | ((value & 0x03) << 10)
         elif register == 0x2001:
             self.mask = value
         elif register == 0x2002:
-            self.status = value
+            pass # read only
         elif register == 0x2003:
-            self.address = value
+            self.oamAddress = value
         elif register == 0x2004:
-            self.oam[self.address] = value
-            self.address += 1
+            self.oam[self.oamAddress] = value
+            self.oamAddress = (self.oamAddress + 1) & 0xFF
         elif register == 0x2005:
             if self.writeToggle == 0:
-                self.scroll = value
+                self.tempVramAddress = (self.tempVramAddress & 0x7FE0) | (value >> 3)
+                self.fineX = value & 0x07
                 self.writeToggle = 1
             else:
-                self.scroll = (self.scroll << 8) | value
+                self.tempVramAddress = (self.tempVramAddress & 0x0C1F) | ((value & 0x07) << 12) | ((value & 0xF8) << 2)
                 self.writeToggle = 0
-            value = self.scroll
         elif register == 0x2006:
             if self.writeToggle == 0:
-                self.address = (self.address & 0x00FF) | (value << 8)
+                self.tempVramAddress = (self.tempVramAddress & 0x00FF) | ((value & 0x3F) << 8)
                 self.writeToggle = 1
             else:
-                self.address = (self.address & 0xFF00) | value
+                self.tempVramAddress = (self.tempVramAddress & 0x7F00) | value
+                self.vramAddress = self.tempVramAddress
                 self.writeToggle = 0
         elif register == 0x2007:
             self.writeVRAM(value)
-            self.address += 1
-            return
+            self.incrementVramAddress()
         else:
             raise ValueError # Register not found
         
-        # Write to address in the RAM
-        if fromRAM == False: self.ram.writeAddress(UInt16(register), value)
-        if mirrorRegisters: self.mirrorRegisters()
+        # Where the next counter clock is depends on the pattern tables / sprite size / rendering being on
+        if register <= 0x2001 and self.scanlineCounter != None and self.scanlineCounter.irqEnabled: self.console.rescheduleEvents()
     
     def updateStatusRegister(self):
-        binary = f"0b{self.vblank}{self.spriteZeroHit}{self.spriteOverflow}00000"
-        self.writeRegister(0x2002, int(binary, 2))
+        self.status = (self.vblank << 7) | (self.spriteZeroHit << 6) | (self.spriteOverflow << 5)
     
     def reset(self):
         self.vram = bytearray(0x4000)
         self.oam = bytearray(256)
         
+        # numpy views of the same memory for the renderer (no copies, they see every write)
+        self.vramArray = numpy.frombuffer(self.vram, dtype=numpy.uint8)
+        self.oamArray = numpy.frombuffer(self.oam, dtype=numpy.uint8).reshape(64, 4) # y, tile, attributes, x
+        
+        # Pattern tables, VRAM's own $0000-$1FFF as CHR RAM until a cartridge's mapper brings its CHR (see Mapper.py).
+        # Pre-decoded into 8x8 tiles for the renderer and the pattern table viewer
+        self.setCHRMemory(memoryview(self.vram)[0x0000:0x2000], True)
+        
         self.ppuDataBuffer = 0
+        self.openBus = 0
         
-        self.vramAddress = 0
-        self.tempVramAddress = 0
-        self.fineX = 0
-        self.writeToggle = 0
+        self.ctrl = 0
+        self.mask = 0
+        self.oamAddress = 0
+        
+        self.vramAddress = 0 # v
+        self.tempVramAddress = 0 # t
+        self.fineX = 0 # x
+        self.writeToggle = 0 # w
         
         # PPU STATUS
         self.status = 0x00
@@ -270,15 +534,12 @@ class PPU:
         self.spriteZeroHit = 0 # bit 6
         self.spriteOverflow = 0 # bit 5
         
-        self.writeRegister(0x2000, 0)
-        self.writeRegister(0x2001, 0)
         self.updateStatusRegister()
-        self.writeRegister(0x2003, 0)
-        self.writeRegister(0x2005, 0)
-        self.writeRegister(0x2006, 0, True)
         
         self.scanline = 0
         self.cycle = 0
+        self.frameDot = (self.scanline + 1) * DOTS_PER_SCANLINE
+        self.dots = 0 # Total dots run, kept in step with the CPU's cycle count
         
         
         # Pattern memory
@@ -0,0 +1,100 @@
+# Rewind
+# Keeps the last few seconds / minutes of savestates (one per frame) so the console can step backwards.
+
+# Most of a savestate doesn't change from one frame to the next, so only every keyframeInterval-th
+# frame is stored whole. Every other frame is stored as the XOR of its state with that keyframe: the bytes
+# that didn't change become zeros, which zlib squeezes down to almost nothing.
+# When the history goes over its memory budget the oldest keyframe is thrown away together with
+# every frame that was stored against it.
+
+from collections import deque
+import zlib
+
+import numpy
+
+class RewindFrame():
+    def __init__(self, data: bytes, keyframe: "RewindFrame | None") -> None:
+        self.data = data # zlib compressed, the whole state for a keyframe, the XOR with the keyframe otherwise
+        self.keyframe = keyframe # None when this is a keyframe
+
+class Rewind():
+    def __init__(self, console, budgetBytes: int = 8 * 1024 * 1024, keyframeInterval: int = 60) -> None:
+        self.console = console
+        self.budgetBytes = budgetBytes
+        self.keyframeInterval = keyframeInterval
+        
+        self.frames: deque[RewindFrame] = deque()
+        self.usedBytes = 0
+        
+        # The keyframe new frames are stored against, and its state uncompressed
+        self.keyframe: RewindFrame | None = None
+        self.keyframeState: bytes | None = None
+        self.framesSinceKeyframe = 0
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+    
+    def capture(self):
+        # Call once per frame, after the frame is done
+        state = self.console.saveState()
+        
+        if self.keyframe == None or self.framesSinceKeyframe >= self.keyframeInterval or len(state) != len(self.keyframeState):
+            frame = RewindFrame(zlib.compress(state, 1), None)
+            self.keyframe = frame
+            self.keyframeState = state
+            self.framesSinceKeyframe = 0
+        else:
+            delta = numpy.bitwise_xor(numpy.frombuffer(state, dtype=numpy.uint8), numpy.frombuffer(self.keyframeState, dtype=numpy.uint8))
+            frame = RewindFrame(zlib.compress(delta.tobytes(), 1), self.keyframe)
+        
+        self.frames.append(frame)
+        self.usedBytes += len(frame.data)
+        self.framesSinceKeyframe += 1
+        self.evict()
+    
+    def evict(self):
+        # Drop whole keyframe groups from the old end, but never the group still being written
+        while self.usedBytes > self.budgetBytes and self.frames[0] is not self.keyframe:
+            self.dropOldest()
+            while len(self.frames) > 0 and self.frames[0].keyframe != None and self.frames[0] is not self.keyframe:
+                self.dropOldest()
+    
+    def dropOldest(self):
+        self.usedBytes -= len(self.frames.popleft().data)
+    
+    def stepBack(self, frames: int = 1) -> bool:
+        # Go back `frames` frames from the last capture. False (and nothing changes) when there isn't that much history
+        if frames >= len(self.frames): return False
+        
+        for i in range(frames):
+            self.usedBytes -= len(self.frames.pop().data)
+        
+        frame = self.frames[-1]
+        keyframe = frame if frame.keyframe == None else frame.keyframe
+        if keyframe is not self.keyframe:
+            self.keyframe = keyframe
+            self.keyframeState = zlib.decompress(keyframe.data)
+        self.framesSinceKeyframe = self.countSinceKeyframe()
+        
+        self.console.loadState(self.stateOf(frame))
+        return True
+    
+    def stateOf(self, frame: RewindFrame) -> bytes:
+        if frame.keyframe == None: return zlib.decompress(frame.data)
+        
+        delta = numpy.frombuffer(zlib.decompress(frame.data), dtype=numpy.uint8)
+        return numpy.bitwise_xor(delta, numpy.frombuffer(self.keyframeState, dtype=numpy.uint8)).tobytes()
+    
+    def countSinceKeyframe(self) -> int:
+        count = 0
+        for frame in reversed(self.frames):
+            count += 1
+            if frame is self.keyframe: break
+        return count
+    
+    def clear(self):
+        self.frames.clear()
+        self.usedBytes = 0
+        self.keyframe = None
+        self.keyframeState = None
+        self.framesSinceKeyframe = 0
@@ -0,0 +1,122 @@
+# Savestates
+# The whole console in one binary blob:
+#   header   magic, format version, flags, CRC32 of the PRG ROM it belongs to
+#   CPU      registers, flags, cycle count, interrupt lines
+#   PPU      registers, loopy v/t/x/w, status bits, where it is in the frame
+#   console  next PPU event cycle, mapper state (length + bytes: bank registers and CHR RAM, see Mapper.py)
+#   memory   internal RAM, PRG RAM, $4000-$5FFF, PPU VRAM, OAM, the frame buffer
+# The memory blocks are copied straight out of (and back into) the live buffers through memoryviews,
+# so a snapshot is a few joins and a restore is a handful of slice assignments. Cheap enough to take one every frame.
+# Blobs can be zlib compressed, loadState() works either way.
+
+import struct
+import zlib
+
+SAVESTATE_MAGIC = b"NESS"
+SAVESTATE_VERSION = 2 # 2: CHR RAM moved into the mapper state
+FLAG_COMPRESSED = 0x01
+
+HEADER = struct.Struct("<4sHHI") # magic, version, flags, PRG CRC32
+
+# A X Y SP pc nzResult flags(V B D I C) cycles nmiPending irqLine halted
+CPU_STATE = struct.Struct("<BBBBHHBQBBB")
+
+# ctrl mask oamAddress v t x w vblank spriteZeroHit spriteOverflow ppuDataBuffer openBus scanline cycle frameDot dots frameComplete mirroring
+PPU_STATE = struct.Struct("<BBBHHBBBBBBBhHIQBB") # scanline is -1 on the pre-render line
+
+# nextPPUEventCycle, mapper state length
+CONSOLE_STATE = struct.Struct("<QI")
+
+MIRRORING_MODES = ("horizontal", "vertical", "singleLow", "singleHigh", "fourScreen")
+
+def memoryBlocks(console) -> list:
+    # Every big buffer, in the order they're stored. Each one's size never changes
+    return [console.bus.internalRAM, console.bus.prgRAM, console.bus.expansion, console.ppu.vram, console.ppu.oam, console.screen.pixels]
+
+def prgChecksum(console) -> int:
+    return zlib.crc32(console.bus.prgROM)
+
+
+def saveState(console, compress: bool = False) -> bytes:
+    cpu = console.cpu
+    ppu = console.ppu
+    
+    cpuFlags = (cpu.overflowFlag << 4) | (cpu.breakFlag << 3) | (cpu.decimalModeFlag << 2) | (cpu.interruptDisableFlag << 1) | cpu.carryFlag
+    cpuState = CPU_STATE.pack(
+        cpu.accumulatorRegister, cpu.XRegister, cpu.YRegister, cpu.stackPointer, cpu.pc, cpu.nzResult, cpuFlags,
+        cpu.cycles, cpu.nmiPending, cpu.irqLine, cpu.haltAllExecutionBecauseOfNoInstruction
+    )
+    ppuState = PPU_STATE.pack(
+        ppu.ctrl, ppu.mask, ppu.oamAddress, ppu.vramAddress, ppu.tempVramAddress, ppu.fineX, ppu.writeToggle,
+        ppu.vblank, ppu.spriteZeroHit, ppu.spriteOverflow, ppu.ppuDataBuffer, ppu.openBus,
+        ppu.scanline, ppu.cycle, ppu.frameDot, ppu.dots, ppu.frameComplete, MIRRORING_MODES.index(ppu.mirroring)
+    )
+    
+    mapper = getattr(console, "mapper", None)
+    mapperState = mapper.saveState() if mapper != None else b""
+    consoleState = CONSOLE_STATE.pack(console.nextPPUEventCycle, len(mapperState))
+    
+    body = b"".join([cpuState, ppuState, consoleState, mapperState] + [memoryview(block).cast("B") for block in memoryBlocks(console)])
+    
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1) # level 1, most of a state is zeros and fast beats small here
+        flags |= FLAG_COMPRESSED
+    
+    return HEADER.pack(SAVESTATE_MAGIC, SAVESTATE_VERSION, flags, prgChecksum(console)) + body
+
+def loadState(console, data: bytes):
+    magic, version, flags, checksum = HEADER.unpack_from(data, 0)
+    if magic != SAVESTATE_MAGIC: raise ValueError("Not a savestate")
+    if version != SAVESTATE_VERSION: raise ValueError(f"Savestate version {version} isn't supported (expected {SAVESTATE_VERSION})")
+    if checksum != prgChecksum(console): raise ValueError("Savestate was made with a different cartridge")
+    
+    body = memoryview(data)[HEADER.size:]
+    if flags & FLAG_COMPRESSED: body = memoryview(zlib.decompress(body))
+    
+    cpu = console.cpu
+    ppu = console.ppu
+    offset = 0
+    
+    (cpu.accumulatorRegister, cpu.XRegister, cpu.YRegister, cpu.stackPointer, cpu.pc, cpu.nzResult, cpuFlags,
+     cpu.cycles, nmiPending, irqLine, halted) = CPU_STATE.unpack_from(body, offset)
+    offset += CPU_STATE.size
+    cpu.overflowFlag = (cpuFlags & 0x10) != 0
+    cpu.breakFlag = (cpuFlags & 0x08) != 0
+    cpu.decimalModeFlag = (cpuFlags & 0x04) != 0
+    cpu.interruptDisableFlag = (cpuFlags & 0x02) != 0
+    cpu.carryFlag = (cpuFlags & 0x01) != 0
+    cpu.nmiPending = nmiPending != 0
+    cpu.irqLine = irqLine != 0
+    cpu.haltAllExecutionBecauseOfNoInstruction = halted != 0
+    
+    (ppu.ctrl, ppu.mask, ppu.oamAddress, ppu.vramAddress, ppu.tempVramAddress, ppu.fineX, ppu.writeToggle,
+     ppu.vblank, ppu.spriteZeroHit, ppu.spriteOverflow, ppu.ppuDataBuffer, ppu.openBus,
+     ppu.scanline, ppu.cycle, ppu.frameDot, ppu.dots, frameComplete, mirroring) = PPU_STATE.unpack_from(body, offset)
+    offset += PPU_STATE.size
+    ppu.frameComplete = frameComplete != 0
+    ppu.setMirroring(MIRRORING_MODES[mirroring])
+    ppu.updateStatusRegister()
+    
+    console.nextPPUEventCycle, mapperStateLength = CONSOLE_STATE.unpack_from(body, offset)
+    offset += CONSOLE_STATE.size
+    mapper = getattr(console, "mapper", None)
+    if mapper != None: mapper.loadState(body[offset:offset + mapperStateLength])
+    offset += mapperStateLength
+    
+    for block in memoryBlocks(console):
+        view = memoryview(block).cast("B")
+        view[:] = body[offset:offset + len(view)]
+        offset += len(view)
+    
+    # Everything that was worked out from the old memory
+    cpu.blockCompiler.invalidateRAM()
+    cpu.idleLoop.forget()
+    cpu.idleLoop.cycleLimit = console.nextPPUEventCycle
+    ppu.tileCache.invalidateAll()
+
+def saveStateToFile(console, path: str, compress: bool = True):
+    with open(path, "wb") as f: f.write(saveState(console, compress))
+
+def loadStateFromFile(console, path: str):
+    with open(path, "rb") as f: loadState(console, f.read())
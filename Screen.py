@@ -1,23 +1,82 @@
 from __future__ import annotations
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
-import PIL.Image
 import pygame
-import sys
+import json
 import time
-import PIL
+import numpy
+
+from FrameBuffer import FrameBuffer
+from FramePacer import FramePacer
+
+FONT_NAME = "Retro Gaming"
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fontCache.json")
+
+# Everything the register panel ever writes
+REGISTER_CHARACTERS = "0123456789ABCDEF$[] "
+
+# Posted (from the emulation thread) when a new frame is ready, see notifyFrame
+FRAME_EVENT = pygame.USEREVENT + 1
+
+def loadFont(name: str, size: int) -> pygame.font.Font:
+    # pygame.font.SysFont scans every system font folder for one name (thousands of stat / listdir calls at startup),
+    # so the path it finds is kept in fontCache.json and the scan only happens once. "" means the font isn't
+    # installed and pygame's own font gets used
+    cache = {}
+    try:
+        with open(FONT_CACHE_PATH, "r") as f: cache = json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    path = cache.get(name)
+    if path == None or (path != "" and os.path.exists(path) == False):
+        path = pygame.font.match_font(name) or ""
+        cache[name] = path
+        try:
+            with open(FONT_CACHE_PATH, "w") as f: json.dump(cache, f)
+        except OSError:
+            pass # read only checkout, scan again next time
+    
+    return pygame.font.Font(path if path != "" else None, size)
+
+class GlyphAtlas():
+    # A set of characters rendered once into one surface, a fixed width cell each.
+    # Drawing text is then one blits() call of cells instead of a font.render every time
+    def __init__(self, font: pygame.font.Font, characters: str, color, background) -> None:
+        glyphs = [font.render(character, False, color, background) for character in characters]
+        self.cellWidth = max(glyph.get_width() for glyph in glyphs)
+        self.height = font.get_height()
+        
+        self.surface = pygame.Surface((self.cellWidth * len(characters), self.height))
+        self.surface.fill(background)
+        self.cells = {}
+        for index, (character, glyph) in enumerate(zip(characters, glyphs)):
+            cell = pygame.Rect(index * self.cellWidth, 0, self.cellWidth, self.height)
+            self.surface.blit(glyph, glyph.get_rect(center=cell.center))
+            self.cells[character] = cell
+    
+    def draw(self, target: pygame.Surface, text: str, position: tuple[int, int]):
+        # Cells are opaque, so drawing over older text of the same length replaces it
+        x, y = position
+        target.blits([(self.surface, (x + index * self.cellWidth, y), self.cells[character]) for index, character in enumerate(text)], doreturn=False)
 
 # ripped somewhat from https://github.com/Circuitbreaker08/Party-Gaming/blob/main/main.py
 class Screen():
     def __init__(self) -> None:
         pygame.init()
-        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, FRAME_EVENT])
         pygame.font.init()
         self.fontSize = 32
-        self.font = pygame.font.SysFont("Retro Gaming", 32)
+        self.font = loadFont(FONT_NAME, 32)
         
         self.didQuit = False
         
+        # Keys turn into commands for whatever runs the console (EmulationThread.send), nothing is sent while it's None
+        self.sendCommand = None
+        self.frameReady = False
+        self.framePosted = False
+        self.speed = 1.0 # - and = halve / double it, hold tab to run uncapped
+        
         self.queuedDraw = [
             [self.font.render("STATUS:", False, (255,255,255)), (512,self.fontSize*0)],
             [self.font.render("PC:", False, (255,255,255)), (512,self.fontSize*1)],
@@ -62,6 +121,10 @@ class Screen():
         
         self.backgroundColor = (20, 20, 255)
         
+        # Register values come out of an atlas and only get drawn when they change
+        self.registerAtlas = GlyphAtlas(self.font, REGISTER_CHARACTERS, (255,255,255), self.backgroundColor)
+        self.registersPrev = (None, None, None, None, None)
+        
         self.lastFrame = time.time_ns()
         
         # NES resolution (256x224)
@@ -69,6 +132,12 @@ class Screen():
         self.screen = pygame.display.set_mode((1024, 512))
         self.screen.fill(self.backgroundColor)
         
+        # The frame gets copied into nesSurface in one go, then scaled straight onto the viewport (part of the window)
+        #   "nearest" keeps the pixels sharp, "smooth" filters them
+        self.nesSurface = pygame.Surface((256, 240), 0, self.screen) # same pixel format as the window so scale can write into it
+        self.viewport = self.screen.subsurface(pygame.Rect(0, 0, 512, 512))
+        self.scalingMode = "nearest"
+        
         # Palette Boxes
         palettePixelSize = (14, 14)
         self.palettePixel: pygame.Rect = pygame.Rect(0, 0, palettePixelSize[0], palettePixelSize[1])
@@ -96,7 +165,8 @@ class Screen():
         # set NES Screen to black
         #pygame.draw.rect(self.screen, (0,0,0), pygame.Rect(0,0, 512, 512))
         
-        self.clock = pygame.time.Clock()
+        # Only for tick(), when this runs without an EmulationThread (which has its own)
+        self.pacer = FramePacer()
     
     def drawStatusRegister(self, n, v, b, d, i, z, c):
         if n != self.negativePrev: self.queuedDraw.append(self.negativeTextOn if n else self.negativeTextOff)
@@ -115,12 +185,17 @@ class Screen():
         self.zeroPrev = z
         self.carryPrev = c
     
-    def drawRegisters(self, programCounter, accumulator, x, y, stackPointer):
-        self.queuedDraw.append( [self.font.render(programCounter, False, (255,255,255)), (512 + self.fontSize*2, self.fontSize*1)] )
-        self.queuedDraw.append( [self.font.render(accumulator, False, (255,255,255)), (512 + self.fontSize*2, self.fontSize*2)] )
-        self.queuedDraw.append( [self.font.render(x, False, (255,255,255)), (512 + self.fontSize*2, self.fontSize*3)] )
-        self.queuedDraw.append( [self.font.render(y, False, (255,255,255)), (512 + self.fontSize*2, self.fontSize*4)] )
-        self.queuedDraw.append( [self.font.render(stackPointer, False, (255,255,255)), (512 + self.fontSize*2, self.fontSize*5)] )
+    def drawRegisters(self, programCounter: int, accumulator: int, x: int, y: int, stackPointer: int):
+        registers = (programCounter, accumulator, x, y, stackPointer)
+        for row, (value, previous) in enumerate(zip(registers, self.registersPrev)):
+            if value == previous: continue
+            
+            if row == 0: text = f"${value:04X}"
+            elif row == 4: text = f"$00{value:02X}"
+            else: text = f"${value:02X}  [{value}]".ljust(10) # padded so a shorter number covers a longer one
+            self.registerAtlas.draw(self.screen, text, (512 + self.fontSize*2, self.fontSize*(row + 1)))
+        
+        self.registersPrev = registers
     
     
     def ns_to_ss_ms(self, ns):
@@ -133,7 +208,7 @@ class Screen():
         milliseconds = (ns % NS_PER_SECOND) // NS_PER_MILLISECOND
         return f"{seconds:02}:{milliseconds:03}"
     
-    def updateScreen(self, screenFromNES: WriteableScreen):
+    def updateScreen(self, screenFromNES: FrameBuffer):
         #now = time.time_ns()
         #FPS = round(1/(((now-self.lastFrame)//1_000_000)*0.001))
         #print(f"Time to generate frame: {self.ns_to_ss_ms(now-self.lastFrame)} ~ FPS: {FPS}")
@@ -141,14 +216,24 @@ class Screen():
         #sys.exit()
         
         # Draw NES screen
-        for x in range(len(screenFromNES.pixels)):
-            column = screenFromNES.pixels[x]
-            for y in range(len(column)):
-                pixelColor = column[y]
-                self.screen.set_at((x,y), pixelColor)
+        # One palette lookup for the whole frame, one array copy into the surface and one scaled blit
+        if self.nesSurface.get_size() != (screenFromNES.width, screenFromNES.height):
+            self.nesSurface = pygame.Surface((screenFromNES.width, screenFromNES.height), 0, self.screen)
+        
+        # surfarray wants [x][y], the framebuffer is [y][x] (swapaxes is only a view, nothing is copied)
+        pygame.surfarray.blit_array(self.nesSurface, screenFromNES.toRGB().swapaxes(0, 1))
+        
+        if self.scalingMode == "smooth":
+            pygame.transform.smoothscale(self.nesSurface, self.viewport.get_size(), self.viewport)
+        else:
+            pygame.transform.scale(self.nesSurface, self.viewport.get_size(), self.viewport)
         
         self.lastFrame = time.time_ns()
     
+    def setScalingMode(self, scalingMode: str):
+        if scalingMode not in ("nearest", "smooth"): raise ValueError(f"Unknown scaling mode {scalingMode}")
+        self.scalingMode = scalingMode
+    
     def updatePalettes(self, paletteIndexes: list[int] = [], paletteColors: list[tuple[int,int,int]] = []):
         while len(paletteColors) < len(paletteIndexes)*4:
             paletteColors.append((127,127,127))
@@ -165,87 +250,89 @@ class Screen():
             self.screen.fill(paletteColors[i+3], self.paletteBoxes[first+3])
             i += 4
     
-    def drawPatternTable(self, tableData: bytearray, patternTableIndex: int):
+    def drawPatternTable(self, patternTable: numpy.ndarray, patternTableIndex: int):
+        # patternTable is 128x128 pixel values (0-3) from the PPU's tile cache. Colour it with the active palette and blit it once
         startX = 512 + (150 * patternTableIndex)
         startY = self.fontSize * 9
         
-        patternPixelSize = [8] * 2
-        patternPixel: pygame.Rect = pygame.Rect(0, 0, patternPixelSize[0], patternPixelSize[1])
-
-        
-        
-        for i in range(256): # 265 tiles 16x16 8 pixel tiles
-            startAddress = i * 16
-            tile = tableData[startAddress:startAddress+16]
-
-            lowerPlane = tile[:8]
-            upperPlane = tile[8:]
-            
-            tileX = (i % 16) * patternPixelSize[0]
-            tileY = (i // 16) * patternPixelSize[1]
-            
-            for y in range(8): # Row
-                for x in range(8): # Each pixel in row
-                    lowerBit = (lowerPlane[y] >> (7 - x)) & 1
-                    upperBit = (upperPlane[y] >> (7 - x)) & 1
-                    colorIndex = (upperBit << 1) | lowerBit
-                    
-                    newPixel = patternPixel.move(startX + tileX + x,  startY + tileY + y)
-                    
-                    color = self.activePalette[colorIndex]
-                    self.screen.fill(color, newPixel)
-        
+        paletteLUT = numpy.array(self.activePalette[:4], dtype=numpy.uint8)
+        patternSurface = pygame.surfarray.make_surface(paletteLUT[patternTable].swapaxes(0, 1))
+        self.screen.blit(patternSurface, (startX, startY))
     
     def tick(self):
-        keys = pygame.key.get_pressed()
-        events = pygame.event.get()
+        # Once per emulated frame
+        self.handleEvents(pygame.event.get())
+        if self.didQuit: return
+        
+        self.present()
+        self.pacer.waitForNextFrame()
+    
+    def waitForEvent(self):
+        # Sleeps until a key, quit or a new frame (FRAME_EVENT) comes in instead of flipping the same picture over and over
+        self.handleEvents([pygame.event.wait()] + pygame.event.get())
+    
+    def notifyFrame(self):
+        # Safe to call from any thread. Only one FRAME_EVENT is ever waiting, the window reads the newest frame anyway
+        if self.framePosted: return
+        self.framePosted = True
+        pygame.event.post(pygame.event.Event(FRAME_EVENT))
+    
+    def command(self, name: str, *arguments):
+        if self.sendCommand != None: self.sendCommand(name, *arguments)
+    
+    def setTitle(self, title: str):
+        pygame.display.set_caption(title)
+    
+    def handleEvents(self, events):
         for event in events:
             if event.type == pygame.QUIT:
                 self.quit()
                 return
+            elif event.type == FRAME_EVENT:
+                self.framePosted = False
+                self.frameReady = True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_TAB:
+                    self.command("setUncapped", True)
             elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_TAB:
+                    self.command("setUncapped", False)
+                if event.key == pygame.K_MINUS or event.key == pygame.K_EQUALS:
+                    self.speed = max(0.25, self.speed / 2) if event.key == pygame.K_MINUS else min(8.0, self.speed * 2)
+                    self.command("setSpeed", self.speed)
                 if event.key == pygame.K_SPACE:
-                    isPaused = getattr(sys.modules["__main__"], "isPaused")
-                    setattr(sys.modules["__main__"], "isPaused", isPaused==False)
+                    self.command("togglePause")
                 if event.key == pygame.K_RIGHTBRACKET:
-                    setattr(sys.modules["__main__"], "unpausedForOneTick", True)
+                    self.command("step")
+                if event.key == pygame.K_LEFTBRACKET:
+                    self.command("rewind")
+                if event.key == pygame.K_s:
+                    self.setScalingMode("smooth" if self.scalingMode == "nearest" else "nearest")
                 if event.key == pygame.K_p:
+                    # The next frame comes with the palettes and pattern tables, drawn with the new palette
                     self.activePaletteIndex += 1
                     self.activePaletteIndex %= 8
-                    sys.modules["__main__"].updateScreenPalettes()
-                    sys.modules["__main__"].reloadPatternTables()
-                    
-
+                    self.command("debugViews")
+    
+    def present(self):
         for queued in self.queuedDraw:
             positionedRect: pygame.Rect = queued[0].get_rect(topleft=queued[1])
             pygame.draw.rect(self.screen, self.backgroundColor, positionedRect)
             self.screen.blit(queued[0], queued[1])
         self.queuedDraw = []
-
+        
         pygame.display.flip()
-        self.clock.tick(60) # Come back to this and see if a system needs to replace this (NES works at 60 fps always)
 
     def quit(self):
-        pygame.quit()
+        # Only marks it, the emulation thread can still be posting FRAME_EVENTs. Call close() once that's stopped
         self.didQuit = True
-
-
-class WriteableScreen():
-    def __init__(self, size: tuple[int,int] = (256,240)) -> None:
-        self.pixels: list[ list[ tuple[int,int,int] ] ] = [] # 2D array of colors pixels[x][y] = COLOR
-        for x in range(size[0]):
-            self.pixels.append([])
-            for y in range(size[1]):
-                self.pixels[x].append( (0,0,0) ) # just black as the default color
-
-    def setPixel(self, x: int, y: int, color: tuple[int,int,int] = (0,0,0)):
-        try:
-            self.pixels[x][y] = color
-        except IndexError:
-            pass
+    
+    def close(self):
+        pygame.quit()
 
 
 if __name__ == "__main__":
     screen = Screen()
-    while True:
-        screen.tick()
\ No newline at end of file
+    while screen.didQuit == False:
+        screen.tick()
+    screen.close()
\ No newline at end of file
@@ -0,0 +1,73 @@
+# Decoded CHR tiles
+# https://www.nesdev.org/wiki/PPU_pattern_tables
+
+# Pattern memory is made of tiles of 16 bytes. Each tile is 8x8 pixels with 2 bit planes:
+#   bytes 0-7 are the low bit of each row, bytes 8-15 the high bit. Bit 7 is the leftmost pixel
+# The cache keeps every tile of the cartridge's CHR (ROM or RAM, any size) already decoded as an 8x8 array
+# of pixel values (0-3) so nothing has to pull bits apart while rendering. Writes (CHR RAM) only mark tiles dirty,
+# they're decoded again (all in one go) the next time the cache is read.
+
+# The PPU sees 512 tiles at a time ($0000-$1FFF). tileMap says which CHR tile each of those is,
+# so a bank switch just rewrites 64 entries of it per 1KB, nothing gets decoded again
+
+import numpy
+
+TILE_SIZE = 16 # bytes
+TILES_PER_BANK = 64 # 1KB
+PATTERN_TILES = 512 # $0000-$1FFF
+
+class TileCache():
+    def __init__(self, patternMemory) -> None:
+        # patternMemory is all of the CHR ROM / RAM, anything with the buffer protocol (bytearray, memoryview)
+        self.patternMemory = patternMemory
+        self.tileCount = len(patternMemory) // TILE_SIZE
+        
+        self.tiles = numpy.zeros((self.tileCount, 8, 8), dtype=numpy.uint8) # tiles[tile, row, column]
+        self.dirty = numpy.ones(self.tileCount, dtype=numpy.bool_)
+        self.anyDirty = True
+        
+        # Pattern table tile (0-511) -> tile in patternMemory. Straight through until a mapper says otherwise
+        self.tileMap = numpy.arange(PATTERN_TILES, dtype=numpy.intp) % self.tileCount
+    
+    def decodeTiles(self, tileIndexes):
+        # 16 bytes per tile -> (tiles, 2 planes, 8 rows) -> unpackbits splits every row into 8 pixels
+        data = numpy.frombuffer(self.patternMemory, dtype=numpy.uint8, count=self.tileCount * TILE_SIZE).reshape(self.tileCount, 2, 8)[tileIndexes]
+        lowPlane = numpy.unpackbits(data[:, 0, :, None], axis=2)
+        highPlane = numpy.unpackbits(data[:, 1, :, None], axis=2)
+        self.tiles[tileIndexes] = lowPlane | (highPlane << 1)
+    
+    def refresh(self):
+        if self.anyDirty == False: return
+        
+        self.decodeTiles(numpy.flatnonzero(self.dirty))
+        self.dirty[:] = False
+        self.anyDirty = False
+    
+    def mapBank(self, window: int, offset: int):
+        # 1KB window (0-7) of $0000-$1FFF now shows the CHR starting at offset
+        firstTile = offset // TILE_SIZE
+        self.tileMap[window * TILES_PER_BANK : (window + 1) * TILES_PER_BANK] = numpy.arange(firstTile, firstTile + TILES_PER_BANK)
+    
+    def invalidateAddress(self, address: int):
+        # A single byte of CHR RAM changed, address is the offset into patternMemory
+        self.dirty[address >> 4] = True
+        self.anyDirty = True
+    
+    def invalidateRange(self, startAddress: int, endAddress: int):
+        # CHR RAM got rewritten in bulk, endAddress is exclusive
+        self.dirty[startAddress >> 4 : (endAddress - 1) // TILE_SIZE + 1] = True
+        self.anyDirty = True
+    
+    def invalidateAll(self):
+        self.invalidateRange(0, self.tileCount * TILE_SIZE)
+    
+    def getTile(self, tileIndex: int) -> numpy.ndarray:
+        # tileIndex is a pattern table tile (0-511), through whatever banks are mapped
+        self.refresh()
+        return self.tiles[self.tileMap[tileIndex]]
+    
+    def getPatternTable(self, tableIndex: int) -> numpy.ndarray:
+        # 128x128 picture of one pattern table (16x16 tiles), pixels[y][x] = pixel value (0-3)
+        self.refresh()
+        table = self.tiles[self.tileMap[tableIndex * 256 : tableIndex * 256 + 256]]
+        return table.reshape(16, 16, 8, 8).transpose(0, 2, 1, 3).reshape(128, 128)
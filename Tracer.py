@@ -0,0 +1,104 @@
+# Instruction tracer
+# Every traced instruction is one fixed size binary record in a preallocated ring buffer
+# (a bytearray, or a memory mapped file when a path is given). Nothing gets formatted while the
+# CPU runs, the nestest.log style text is only built when someone asks for it (lines() / text()).
+# Once the buffer is full the oldest records get overwritten, so a long run keeps its last `capacity` instructions.
+
+# The CPU only traces while cpu.tracer is set. Without one it runs its fast paths (blocks, idle loop skipping)
+# and pays nothing for tracing.
+
+import mmap
+import struct
+
+from Opcodes import OPCODES, IMPLIED, ACCUMULATOR, IMMEDIATE, ZEROPAGE, ZEROPAGE_X, ZEROPAGE_Y, ABSOLUTE, ABSOLUTE_X, ABSOLUTE_Y, INDIRECT, INDIRECT_X, INDIRECT_Y, RELATIVE
+from PPU import DOTS_PER_SCANLINE, DOTS_PER_FRAME
+
+# cycle, PPU dot in the frame, pc, address, pointer, opcode, operand low / high, A, X, Y, P, SP, value (+ padding to 32 bytes)
+# address / pointer / value are whatever the operand column needs, read before the instruction ran:
+#   the effective address and the byte there, the zero page pointer or base address (indexed indirect), the JMP (ind) target
+RECORD = struct.Struct("<QIHHHBBBBBBBBB5x")
+
+class Tracer():
+    def __init__(self, capacity: int = 0x10000, path: str | None = None) -> None:
+        self.capacity = capacity
+        self.path = path
+        self.count = 0 # records written since the last clear, including overwritten ones
+        
+        size = capacity * RECORD.size
+        if path == None:
+            self.file = None
+            self.buffer = bytearray(size)
+        else:
+            self.file = open(path, "w+b")
+            self.file.truncate(size)
+            self.buffer = mmap.mmap(self.file.fileno(), size)
+        
+        self.pack = RECORD.pack_into
+    
+    def record(self, cycles: int, pc: int, opcode: int, low: int, high: int, a: int, x: int, y: int, p: int, sp: int, address: int = 0, pointer: int = 0, value: int = 0):
+        # Where the PPU is follows from the cycle count, it's always caught up to cycles * 3
+        self.pack(self.buffer, (self.count % self.capacity) * RECORD.size, cycles, (cycles * 3) % DOTS_PER_FRAME, pc, address, pointer, opcode, low, high, a, x, y, p, sp, value)
+        self.count += 1
+    
+    def clear(self):
+        self.count = 0
+    
+    def close(self):
+        if self.file == None: return
+        self.buffer.close()
+        self.file.close()
+        self.file = None
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def records(self):
+        # Unpacked records, oldest first
+        first = max(0, self.count - self.capacity)
+        for index in range(first, self.count):
+            yield RECORD.unpack_from(self.buffer, (index % self.capacity) * RECORD.size)
+    
+    def lines(self):
+        for record in self.records(): yield formatRecord(record)
+    
+    def text(self) -> str:
+        return "".join(line + "\n" for line in self.lines())
+
+
+def formatRecord(record) -> str:
+    # One line of nestest.log
+    # C000  4C F5 C5  JMP $C5F5                       A:00 X:00 Y:00 P:24 SP:FD PPU:  0, 21 CYC:7
+    cycles, ppuDot, pc, address, pointer, opcode, low, high, a, x, y, p, sp, value = record
+    spec = OPCODES[opcode]
+    
+    operandBytes = f" {low:02X}" if spec.length > 1 else "   "
+    operandBytes += f" {high:02X}" if spec.length > 2 else "   "
+    
+    illegalChar = "*" if spec.illegal else " "
+    instruction = f"{pc:04X}  {opcode:02X}{operandBytes} {illegalChar}{spec.mnemonic} {formatOperand(spec, pc, low, high, address, pointer, value)}"
+    
+    scanline, dot = divmod(ppuDot, DOTS_PER_SCANLINE)
+    return f"{instruction:<48}A:{a:02X} X:{x:02X} Y:{y:02X} P:{p:02X} SP:{sp:02X} PPU:{scanline:3},{dot:3} CYC:{cycles}"
+
+def formatOperand(spec, pc: int, low: int, high: int, address: int, pointer: int, value: int) -> str:
+    mode = spec.mode
+    absolute = (high << 8) | low
+    
+    if mode == IMPLIED: return ""
+    if mode == ACCUMULATOR: return "A"
+    if mode == IMMEDIATE: return f"#${low:02X}"
+    if mode == ZEROPAGE: return f"${low:02X} = {value:02X}"
+    if mode == ZEROPAGE_X: return f"${low:02X},X @ {address:02X} = {value:02X}"
+    if mode == ZEROPAGE_Y: return f"${low:02X},Y @ {address:02X} = {value:02X}"
+    if mode == ABSOLUTE:
+        if spec.mnemonic in ("JMP", "JSR"): return f"${absolute:04X}"
+        return f"${absolute:04X} = {value:02X}"
+    if mode == ABSOLUTE_X: return f"${absolute:04X},X @ {address:04X} = {value:02X}"
+    if mode == ABSOLUTE_Y: return f"${absolute:04X},Y @ {address:04X} = {value:02X}"
+    if mode == INDIRECT: return f"(${absolute:04X}) = {pointer:04X}"
+    if mode == INDIRECT_X: return f"(${low:02X},X) @ {pointer:02X} = {address:04X} = {value:02X}"
+    if mode == INDIRECT_Y: return f"(${low:02X}),Y = {pointer:04X} @ {address:04X} = {value:02X}"
+    if mode == RELATIVE:
+        offset = low - 0x100 if low & 0x80 else low
+        return f"${(pc + 2 + offset) & 0xFFFF:04X}"
+    return ""
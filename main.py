@@ -1,71 +1,21 @@
 from __future__ import annotations
 
-from CPU_Ricoh2A03 import Ricoh2A03
-from RAM import RAM
-from PPU import PPU
-from Cartridge import Cartridge
-
-from Screen import Screen, WriteableScreen
-
-#romPath = "SuperMarioBros.nes"
-#romPath = "nestest.nes"
-#romPath = "NESTestCart.nes"
-
-#with open(romPath, "rb") as f:
-#    romDataBinary = f.read()
-
-class NES():
-    def __init__(self) -> None:
-        self.ram = RAM(self, 1024 * 64) # 64 KB of memory
-        
-        self.totalCycles = 0
-        
-        self.screen: WriteableScreen = WriteableScreen((256,256))
-        self.cartridge: Cartridge = None
-        self.ppu: PPU = PPU(self)
-        self.cpu: Ricoh2A03 = Ricoh2A03(self)
+import argparse
+import time
 
-    def reset(self):
-        self.totalCycles = 0
-        self.cpu.reset()
-        #self.ppu.reset()
-
-    def loadROM(self, romData):
-        self.cpu.loadRom(romData)
-        
-        self.reset()
-
-    def insertCartridge(self, cartridge: Cartridge):
-        self.cartridge = cartridge
-        self.cartridge.writePRGToRam(self.ram)
-        self.cartridge.writeCHRToVram(self.ppu.vram)
-        
-        self.reset()
-
-    def step(self):
-        cpuResponse = -2
-        ppuResponse = 0
-        
-        ppuResponse = self.ppu.step()
-        if self.totalCycles % 3 == 0:
-            cpuResponse = self.cpu.step()
-        
-        self.totalCycles += 1
-        return (cpuResponse, ppuResponse, 0)
-
-nestestCartridge = Cartridge("nestest.nes")
-#dkCartridge = Cartridge("Donkey Kong.nes")
+from NES import NES
+from Cartridge import Cartridge
 
-screen = Screen()
-console = NES()
-#console.loadROM(romDataBinary)
-console.insertCartridge(nestestCartridge)
+from Screen import Screen
+from EmulationThread import EmulationThread, FrameSnapshot
 
-#console.cpu.disassembleInstructions(0xc004, 0xc2BF)
+# The pygame frontend. Importing this doesn't open anything, run it:
+#   python main.py [game.nes] [--trace]
+# NES.py is the same console without a window
 
-isPaused = True
-unpausedForOneTick = False
-owedOneFrameOfUpdate = False
+# --trace keeps the last 64K instructions for cpuOutputLog.txt (CompareResults.py). It runs every instruction
+# through the interpreter (no compiled blocks, no idle loop skipping), so it's far too slow for full speed
+traceCPU = False
 
 def askToDumpCPUOutputLog():
     if input("Do you want to dump the CPU logs? (y/n) ") == "y":
@@ -73,72 +23,64 @@ def askToDumpCPUOutputLog():
         print(f"\n{outputLog}\n")
 
 
-def updateScreenPalettes():
-    for i in range(0, 8):
-        colors = console.ppu.getPaletteFromIndex(i, True)
-        screen.updatePalettes([i], colors)
-
-def reloadPatternTables():
-    screen.drawPatternTable(console.ppu.vram[0x0000:0x1000], 0) # 0x0000 -> 0x0FFF
-    screen.drawPatternTable(console.ppu.vram[0x1000:0x2000], 1) # 0x1000 -> 0x1FFF
-
-def updateScreen():
-    global owedOneFrameOfUpdate
-    if owedOneFrameOfUpdate == False:
-        if isPaused: screen.tick()
-        if console.ppu.frameComplete == False: return
-    else: owedOneFrameOfUpdate = False
+def drawSnapshot(snapshot: FrameSnapshot):
+    screen.drawStatusRegister(*snapshot.flags)
+    screen.drawRegisters(*snapshot.registers)
+    screen.updateScreen(snapshot.frameBuffer)
     
-    screen.drawStatusRegister( console.cpu.negativeFlag, console.cpu.overflowFlag, console.cpu.breakFlag, console.cpu.decimalModeFlag, console.cpu.interruptDisableFlag, console.cpu.zeroFlag, console.cpu.carryFlag )
-    screen.drawRegisters(
-        f"${console.cpu.pc.getHex()}     ",
-        f"${console.cpu.accumulatorRegister.getHex()}  [{console.cpu.accumulatorRegister.getWriteableInt()}]               ",
-        f"${console.cpu.XRegister.getHex()}  [{console.cpu.XRegister.getWriteableInt()}]               ",
-        f"${console.cpu.YRegister.getHex()}  [{console.cpu.YRegister.getWriteableInt()}]               ",
-        f"$00{console.cpu.stackPointer.getHex()}" )
+    if snapshot.palettes != None:
+        for i in range(0, 8):
+            screen.updatePalettes([i], snapshot.palettes[i])
+    if snapshot.patternTables != None:
+        screen.drawPatternTable(snapshot.patternTables[0], 0) # 0x0000 -> 0x0FFF
+        screen.drawPatternTable(snapshot.patternTables[1], 1) # 0x1000 -> 0x1FFF
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NES emulator")
+    parser.add_argument("rom", nargs="?", default="nestest.nes")
+    parser.add_argument("--trace", action="store_true", help="keep an instruction trace and write it to cpuOutputLog.txt")
+    arguments = parser.parse_args()
+    traceCPU = traceCPU or arguments.trace
     
-    if console.ppu.frameComplete: screen.updateScreen(console.screen)
-    console.ppu.frameComplete = False
-    screen.tick()
-
-cpuInstructionLog = open("cpuInstructionLog.txt", "w")
-writes = 0
-
-reloadPatternTables()
-
-while True:
-    if unpausedForOneTick: isPaused = False
-    if screen.didQuit: break
-    if isPaused:
-        updateScreen()
-        continue
+    screen = Screen()
+    console = NES()
+    console.insertCartridge(Cartridge(arguments.rom))
     
-    #if console.totalCycles % 3 == 0:
-    #    writes += 1
-    #    cpuInstructionLog.write(f"{console.cpu.pc.getHex()}\n")
+    if traceCPU: console.cpu.startTrace()
     
-    #if writes >= 59449: break
+    # The console runs on its own thread (starts paused), this one only draws whatever frame it finished last.
+    # Keys become commands (Screen.handleEvents), every finished frame wakes this thread up with a FRAME_EVENT
+    emulation = EmulationThread(console, screen.notifyFrame)
+    screen.sendCommand = emulation.send
+    emulation.start()
     
-    responses = console.step()
-    if responses[0] == -1:
-        # CPU ERROR
-        with open("cpuOutputLog.txt", "w") as f: f.write(console.cpu.outputLog)
-        askToDumpCPUOutputLog()
-        break
-    elif responses[0] == -2:
-        # CPU didnt run. not it's clock cycle
-        pass
-    elif responses[0] == 0:
-        # CPU ran
-        if unpausedForOneTick:
-            isPaused = True
-            unpausedForOneTick = False
-            owedOneFrameOfUpdate = True
+    lastSnapshot = 0
+    lastTitle = 0
+    while screen.didQuit == False:
+        screen.waitForEvent()
+        if screen.didQuit: break
+        
+        if screen.frameReady:
+            screen.frameReady = False
+            snapshot = emulation.frames.read()
+            if snapshot.number != lastSnapshot:
+                drawSnapshot(snapshot)
+                lastSnapshot = snapshot.number
+            
+            # Achieved vs target fps in the title, about once a second
+            if time.perf_counter() - lastTitle >= 1:
+                screen.setTitle(f"NES - {emulation.pacer.report()}")
+                lastTitle = time.perf_counter()
+        screen.present()
+        
+        if emulation.stopped:
+            # CPU ERROR
+            break
     
-    updateScreen()
-
-with open("cpuOutputLog.txt", "w") as f: f.write(console.cpu.outputLog)
-cpuInstructionLog.close()
-
-if input("Dump CPU RAM? (y/n) ")=="y":
-    print(console.ram.dumpRAM())
\ No newline at end of file
+    emulation.stop()
+    screen.close()
+    if console.cpu.tracer != None:
+        with open("cpuOutputLog.txt", "w") as f: f.write(console.cpu.outputLog)
+        if emulation.stopped: askToDumpCPUOutputLog()
+    if input("Dump CPU RAM? (y/n) ")=="y":
+        print(console.bus.dumpRAM())